@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -16,8 +19,22 @@ if TYPE_CHECKING:
 
 __version__ = "0.1.0"
 
+# Exporter for each supported output format
+_DISPATCH: dict[str, Callable[["GraphModel", StyleRegistry], str]] = {
+    "dot": lambda model, styles: DOTExporter(styles).export(model),
+    "svg": lambda model, styles: SVGExporter(styles).export(model),
+    "cytoscape-json": lambda model, styles: CytoscapeExporter(styles).export(model, format="json"),
+    "cytoscape-html": lambda model, styles: CytoscapeExporter(styles).export(model, format="html"),
+}
+
 # Supported output formats
-FORMATS = ["dot", "svg", "cytoscape-json", "cytoscape-html"]
+FORMATS = frozenset(_DISPATCH)
+
+
+@lru_cache(maxsize=1)
+def _default_parser() -> YAMLParser:
+    """Shared parser for the bundled schema, so its file cache persists across calls."""
+    return YAMLParser()
 
 
 def visualize(
@@ -42,36 +59,76 @@ def visualize(
     Raises:
         ValueError: If format is not supported.
     """
-    if format not in FORMATS:
-        raise ValueError(
-            f"Unsupported format: {format}. "
-            f"Supported formats: {', '.join(FORMATS)}"
-        )
+    _check_format(format)
 
-    parser = YAMLParser()
-    model = parser.parse(input_path)
+    model = _default_parser().parse(input_path)
 
     styles = StyleRegistry(theme=theme, max_label_chars=max_label_chars)
 
-    if format == "dot":
-        exporter = DOTExporter(styles)
-        content = exporter.export(model)
-    elif format == "svg":
-        exporter = SVGExporter(styles)
-        content = exporter.export(model)
-    elif format == "cytoscape-json":
-        exporter = CytoscapeExporter(styles)
-        content = exporter.export(model, format="json")
-    elif format == "cytoscape-html":
-        exporter = CytoscapeExporter(styles)
-        content = exporter.export(model, format="html")
+    content = _DISPATCH[format](model, styles)
 
     if output:
-        Path(output).write_text(content)
+        Path(output).write_bytes(content.encode("utf-8"))
 
     return content
 
 
+def visualize_many(
+    input_path: str | Path,
+    outputs: dict[str, str | Path],
+    theme: str | None = None,
+    max_label_chars: int = 100,
+) -> dict[str, str]:
+    """Visualize one argument graph in several formats at once.
+
+    The input is parsed once and the exporters run on a thread pool. Only
+    SVG export overlaps with the others, since its layout runs in a Graphviz
+    subprocess; the DOT and Cytoscape exporters hold the GIL, so their
+    times add up.
+
+    Args:
+        input_path: Path to YAML argument graph file.
+        outputs: Mapping of format name to output file path.
+        theme: Optional path to theme YAML file.
+        max_label_chars: Maximum label length before truncation (default 100).
+
+    Returns:
+        Mapping of format name to visualization content.
+
+    Raises:
+        ValueError: If any format is not supported.
+    """
+    for format in outputs:
+        _check_format(format)
+    if not outputs:
+        return {}
+
+    model = _default_parser().parse(input_path)
+
+    styles = StyleRegistry(theme=theme, max_label_chars=max_label_chars)
+
+    def render_to_file(format: str, output: str | Path) -> str:
+        content = _DISPATCH[format](model, styles)
+        Path(output).write_bytes(content.encode("utf-8"))
+        return content
+
+    with ThreadPoolExecutor(max_workers=min(4, len(outputs))) as pool:
+        futures = {
+            format: pool.submit(render_to_file, format, output)
+            for format, output in outputs.items()
+        }
+        return {format: future.result() for format, future in futures.items()}
+
+
+def _check_format(format: str) -> None:
+    """Raise ValueError if format is not one of FORMATS."""
+    if format not in FORMATS:
+        raise ValueError(
+            f"Unsupported format: {format}. "
+            f"Supported formats: {', '.join(_DISPATCH)}"
+        )
+
+
 def load(input_path: str | Path) -> "GraphModel":
     """Load an argument graph from YAML.
 
@@ -81,5 +138,4 @@ def load(input_path: str | Path) -> "GraphModel":
     Returns:
         GraphModel instance.
     """
-    parser = YAMLParser()
-    return parser.parse(input_path)
+    return _default_parser().parse(input_path)
@@ -8,51 +8,152 @@ from typing import Any
 from argviz.model import GraphModel
 from argviz.styles import StyleRegistry, truncate_label
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
 
-class CytoscapeExporter:
-    """Export argument graphs to Cytoscape formats.
 
-    Supports two output formats:
-    - JSON: For embedding in web applications
-    - HTML: Self-contained interactive viewer
-    """
+def _dumps(data: Any, indent: bool = True) -> str:
+    """Serialize data to JSON, using orjson when installed.
 
-    def __init__(self, styles: StyleRegistry | None = None) -> None:
-        """Initialize exporter.
+    Both paths give the same text; non-ASCII characters are kept as-is.
 
-        Args:
-            styles: Style registry for visual properties. Uses defaults if None.
-        """
-        self.styles = styles or StyleRegistry()
+    Args:
+        data: JSON-serializable data.
+        indent: Indent by 2 spaces if True, otherwise emit compact JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else None).decode()
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
-    def export(self, model: GraphModel, format: str = "json") -> str:
-        """Export graph to Cytoscape format.
 
-        Args:
-            model: The argument graph to export.
-            format: Output format - "json" or "html".
-
-        Returns:
-            JSON string or HTML string.
-        """
-        if format == "json":
-            return self._export_json(model)
-        elif format == "html":
-            return self._export_html(model)
-        else:
-            raise ValueError(f"Unsupported format: {format}")
+# Element data templates: copying a presized dict is cheaper than building a
+# literal of this many keys. Key order here is the key order in the output.
+_NODE_DATA_TEMPLATE: dict[str, Any] = {
+    "id": "",
+    "label": "",
+    "fullText": "",
+    "type": "",
+    "nodeColor": "",
+    "borderColor": "",
+}
+_LINK_DATA_TEMPLATE: dict[str, Any] = {
+    "id": "",
+    "label": "",
+    "fullText": "",
+    "type": "Link",
+    "polarity": "",
+    "nodeColor": "",
+    "borderColor": "",
+}
+_EDGE_DATA_TEMPLATE: dict[str, Any] = {
+    "source": "",
+    "target": "",
+    "edgeType": "link",
+    "edgeColor": "",
+    "lineStyle": "",
+}
 
-    def _export_json(self, model: GraphModel) -> str:
-        """Export to Cytoscape JSON format."""
-        data = self._build_cytoscape_data(model)
-        return json.dumps(data, indent=2)
+# Static stylesheet; per-element colors come through data() mappers
+_STYLE_ARRAY: list[dict[str, Any]] = [
+    # Node styles
+    {
+        "selector": "node[type='Proposition']",
+        "style": {
+            "shape": "round-rectangle",
+            "background-color": "data(nodeColor)",
+            "border-color": "data(borderColor)",
+            "border-width": 1,
+            "label": "data(label)",
+            "text-wrap": "wrap",
+            "text-max-width": "150px",
+            "font-size": "10px",
+            "text-valign": "center",
+            "text-halign": "center",
+            "width": "label",
+            "height": "label",
+            "padding": "10px",
+        },
+    },
+    {
+        "selector": "node[type='Conclusion']",
+        "style": {
+            "shape": "round-rectangle",
+            "background-color": "data(nodeColor)",
+            "border-color": "data(borderColor)",
+            "border-width": 2,  # Thicker border to emphasize terminal claim
+            "label": "data(label)",
+            "text-wrap": "wrap",
+            "text-max-width": "150px",
+            "font-size": "10px",
+            "text-valign": "center",
+            "text-halign": "center",
+            "width": "label",
+            "height": "label",
+            "padding": "10px",
+        },
+    },
+    {
+        "selector": "node[type='Datum']",
+        "style": {
+            "shape": "ellipse",
+            "background-color": "data(nodeColor)",
+            "border-color": "data(borderColor)",
+            "border-width": 1,
+            "label": "data(label)",
+            "text-wrap": "wrap",
+            "text-max-width": "150px",
+            "font-size": "10px",
+            "text-valign": "center",
+            "text-halign": "center",
+            "width": "label",
+            "height": "label",
+            "padding": "10px",
+        },
+    },
+    {
+        "selector": "node[type='Link']",
+        "style": {
+            "shape": "diamond",
+            "background-color": "data(nodeColor)",
+            "border-color": "data(borderColor)",
+            "border-width": 1,
+            "width": 20,
+            "height": 20,
+        },
+    },
+    # Edge styles
+    {
+        "selector": "edge",
+        "style": {
+            "width": 1.5,
+            "line-color": "data(edgeColor)",
+            "target-arrow-color": "data(edgeColor)",
+            "target-arrow-shape": "triangle",
+            "curve-style": "bezier",
+        },
+    },
+    {
+        "selector": "edge[lineStyle='dashed']",
+        "style": {
+            "line-style": "dashed",
+        },
+    },
+]
 
-    def _export_html(self, model: GraphModel) -> str:
-        """Export to self-contained HTML with Cytoscape.js."""
-        data = self._build_cytoscape_data(model)
-        json_data = json.dumps(data, indent=2)
+# Bottom-to-top layered layout, matching rankdir=BT in the DOT export
+_LAYOUT: dict[str, Any] = {
+    "name": "dagre",
+    "rankDir": "BT",
+    "nodeSep": 50,
+    "rankSep": 80,
+}
 
-        html = f'''<!DOCTYPE html>
+# Self-contained viewer page, split around the embedded graph JSON
+_HTML_PREFIX = '''<!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
@@ -61,16 +162,16 @@ class CytoscapeExporter:
     <script src="https://cdnjs.cloudflare.com/ajax/libs/dagre/0.8.5/dagre.min.js"></script>
     <script src="https://cdn.jsdelivr.net/npm/cytoscape-dagre@2.5.0/cytoscape-dagre.min.js"></script>
     <style>
-        body {{
+        body {
             margin: 0;
             padding: 0;
             font-family: Helvetica, Arial, sans-serif;
-        }}
-        #cy {{
+        }
+        #cy {
             width: 100%;
             height: 100vh;
-        }}
-        #tooltip {{
+        }
+        #tooltip {
             position: absolute;
             display: none;
             background: rgba(0, 0, 0, 0.8);
@@ -80,16 +181,18 @@ class CytoscapeExporter:
             max-width: 300px;
             font-size: 12px;
             z-index: 1000;
-        }}
+        }
     </style>
 </head>
 <body>
     <div id="cy"></div>
     <div id="tooltip"></div>
     <script>
-        const graphData = {json_data};
+        const graphData = '''
+
+_HTML_SUFFIX = ''';
 
-        const cy = cytoscape({{
+        const cy = cytoscape({
             container: document.getElementById('cy'),
             elements: graphData.elements,
             style: graphData.style,
@@ -97,101 +200,153 @@ class CytoscapeExporter:
             userZoomingEnabled: true,
             userPanningEnabled: true,
             boxSelectionEnabled: false,
-        }});
+        });
 
         // Tooltip on hover/click
         const tooltip = document.getElementById('tooltip');
 
-        cy.on('tap', 'node', function(evt) {{
+        cy.on('tap', 'node', function(evt) {
             const node = evt.target;
             const fullText = node.data('fullText');
-            if (fullText) {{
+            if (fullText) {
                 tooltip.innerHTML = fullText;
                 tooltip.style.display = 'block';
                 tooltip.style.left = evt.originalEvent.pageX + 10 + 'px';
                 tooltip.style.top = evt.originalEvent.pageY + 10 + 'px';
-            }}
-        }});
+            }
+        });
 
-        cy.on('tap', function(evt) {{
-            if (evt.target === cy) {{
+        cy.on('tap', function(evt) {
+            if (evt.target === cy) {
                 tooltip.style.display = 'none';
-            }}
-        }});
+            }
+        });
     </script>
 </body>
 </html>'''
-        return html
+
+
+class CytoscapeExporter:
+    """Export argument graphs to Cytoscape formats.
+
+    Supports two output formats:
+    - JSON: For embedding in web applications
+    - HTML: Self-contained interactive viewer
+    """
+
+    def __init__(self, styles: StyleRegistry | None = None) -> None:
+        """Initialize exporter.
+
+        Args:
+            styles: Style registry for visual properties. Uses defaults if None.
+        """
+        self.styles = styles or StyleRegistry()
+
+    def export(self, model: GraphModel, format: str = "json") -> str:
+        """Export graph to Cytoscape format.
+
+        Args:
+            model: The argument graph to export.
+            format: Output format - "json" or "html".
+
+        Returns:
+            JSON string or HTML string.
+        """
+        if format == "json":
+            return self._export_json(model)
+        elif format == "html":
+            return self._export_html(model)
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+
+    def _export_json(self, model: GraphModel) -> str:
+        """Export to Cytoscape JSON format."""
+        data = self._build_cytoscape_data(model)
+        return _dumps(data)
+
+    def _export_html(self, model: GraphModel) -> str:
+        """Export to self-contained HTML with Cytoscape.js."""
+        data = self._build_cytoscape_data(model)
+        # Compact: the JSON is only read by the browser
+        json_data = _dumps(data, indent=False)
+        return _HTML_PREFIX + json_data + _HTML_SUFFIX
 
     def _build_cytoscape_data(self, model: GraphModel) -> dict[str, Any]:
         """Build Cytoscape data structure."""
-        nodes = []
-        edges = []
+        if not model.nodes and not model.links:
+            return {
+                "elements": {"nodes": [], "edges": []},
+                "style": _STYLE_ARRAY,
+                "layout": _LAYOUT,
+            }
+
+        nodes: list[dict[str, Any]] = []
+        edges: list[dict[str, Any]] = []
+        # Appends are amortized O(1); presizing was measured slower because
+        # it needs an extra pass over the links to count edges
+        add_node = nodes.append
+        add_edge = edges.append
 
         # Add content nodes
+        max_label_chars = self.styles.max_label_chars
+        labels: dict[str, str] = {}  # content -> truncated label; content often repeats
         for node_id, node in model.nodes.items():
             style = self.styles.get_node_style(node)
             content = node.get("content", node_id)
-            label, _ = truncate_label(content, self.styles.max_label_chars)
-
-            nodes.append({
-                "data": {
-                    "id": node_id,
-                    "label": label,
-                    "fullText": content,
-                    "type": node.get("type", "Proposition"),
-                    "nodeColor": style.fill_color,
-                    "borderColor": style.border_color,
-                }
-            })
+            label = labels.get(content)
+            if label is None:
+                label, _ = truncate_label(content, max_label_chars)
+                labels[content] = label
+
+            data = _NODE_DATA_TEMPLATE.copy()
+            data["id"] = node_id
+            data["label"] = label
+            data["fullText"] = content
+            data["type"] = node.get("type", "Proposition")
+            data["nodeColor"] = style.fill_color
+            data["borderColor"] = style.border_color
+            add_node({"data": data})
+
+        # Sources drawn with dashed edges; a node may feed many links
+        auxiliary_ids = {
+            node_id for node_id, node in model.nodes.items() if node.get("auxiliary", False)
+        }
 
         # Add link nodes
         for link_id, link in model.links.items():
             style = self.styles.get_node_style(link, is_link=True)
             polarity = link.get("polarity", "supports")
 
-            nodes.append({
-                "data": {
-                    "id": link_id,
-                    "label": "",
-                    "fullText": f"Link ({polarity})",
-                    "type": "Link",
-                    "polarity": polarity,
-                    "nodeColor": style.fill_color,
-                    "borderColor": style.border_color,
-                }
-            })
+            data = _LINK_DATA_TEMPLATE.copy()
+            data["id"] = link_id
+            data["fullText"] = f"Link ({polarity})"
+            data["polarity"] = polarity
+            data["nodeColor"] = style.fill_color
+            data["borderColor"] = style.border_color
+            add_node({"data": data})
 
             # Add edges from sources to link
             edge_style = self.styles.get_link_edge_style(link)
+            edge_color = edge_style.line_color
+            edge_line_style = edge_style.line_style
             for source_id in link.get("source_ids", []):
+                data = _EDGE_DATA_TEMPLATE.copy()
+                data["source"] = source_id
+                data["target"] = link_id
+                data["edgeColor"] = edge_color
                 # Use dashed line for edges from auxiliary nodes
-                source_node = model.nodes.get(source_id, {})
-                is_auxiliary = source_node.get("auxiliary", False)
-                line_style = "dashed" if is_auxiliary else edge_style.line_style
-
-                edges.append({
-                    "data": {
-                        "source": source_id,
-                        "target": link_id,
-                        "edgeType": "link",
-                        "edgeColor": edge_style.line_color,
-                        "lineStyle": line_style,
-                    }
-                })
+                data["lineStyle"] = "dashed" if source_id in auxiliary_ids else edge_line_style
+                add_edge({"data": data})
 
             # Add edge from link to target
             target_id = link.get("target_id")
             if target_id:
-                edges.append({
-                    "data": {
-                        "source": link_id,
-                        "target": target_id,
-                        "edgeType": "link",
-                        "edgeColor": edge_style.line_color,
-                        "lineStyle": edge_style.line_style,
-                    }
-                })
+                data = _EDGE_DATA_TEMPLATE.copy()
+                data["source"] = link_id
+                data["target"] = target_id
+                data["edgeColor"] = edge_color
+                data["lineStyle"] = edge_line_style
+                add_edge({"data": data})
 
         # Build style array
         style = self._build_style()
@@ -202,98 +357,9 @@ class CytoscapeExporter:
                 "edges": edges,
             },
             "style": style,
-            "layout": {
-                "name": "dagre",
-                "rankDir": "BT",
-                "nodeSep": 50,
-                "rankSep": 80,
-            },
+            "layout": _LAYOUT,
         }
 
     def _build_style(self) -> list[dict[str, Any]]:
         """Build Cytoscape style array."""
-        return [
-            # Node styles
-            {
-                "selector": "node[type='Proposition']",
-                "style": {
-                    "shape": "round-rectangle",
-                    "background-color": "data(nodeColor)",
-                    "border-color": "data(borderColor)",
-                    "border-width": 1,
-                    "label": "data(label)",
-                    "text-wrap": "wrap",
-                    "text-max-width": "150px",
-                    "font-size": "10px",
-                    "text-valign": "center",
-                    "text-halign": "center",
-                    "width": "label",
-                    "height": "label",
-                    "padding": "10px",
-                },
-            },
-            {
-                "selector": "node[type='Conclusion']",
-                "style": {
-                    "shape": "round-rectangle",
-                    "background-color": "data(nodeColor)",
-                    "border-color": "data(borderColor)",
-                    "border-width": 2,  # Thicker border to emphasize terminal claim
-                    "label": "data(label)",
-                    "text-wrap": "wrap",
-                    "text-max-width": "150px",
-                    "font-size": "10px",
-                    "text-valign": "center",
-                    "text-halign": "center",
-                    "width": "label",
-                    "height": "label",
-                    "padding": "10px",
-                },
-            },
-            {
-                "selector": "node[type='Datum']",
-                "style": {
-                    "shape": "ellipse",
-                    "background-color": "data(nodeColor)",
-                    "border-color": "data(borderColor)",
-                    "border-width": 1,
-                    "label": "data(label)",
-                    "text-wrap": "wrap",
-                    "text-max-width": "150px",
-                    "font-size": "10px",
-                    "text-valign": "center",
-                    "text-halign": "center",
-                    "width": "label",
-                    "height": "label",
-                    "padding": "10px",
-                },
-            },
-            {
-                "selector": "node[type='Link']",
-                "style": {
-                    "shape": "diamond",
-                    "background-color": "data(nodeColor)",
-                    "border-color": "data(borderColor)",
-                    "border-width": 1,
-                    "width": 20,
-                    "height": 20,
-                },
-            },
-            # Edge styles
-            {
-                "selector": "edge",
-                "style": {
-                    "width": 1.5,
-                    "line-color": "data(edgeColor)",
-                    "target-arrow-color": "data(edgeColor)",
-                    "target-arrow-shape": "triangle",
-                    "curve-style": "bezier",
-                },
-            },
-            {
-                "selector": "edge[lineStyle='dashed']",
-                "style": {
-                    "line-style": "dashed",
-                },
-            },
-        ]
+        return _STYLE_ARRAY
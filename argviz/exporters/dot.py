@@ -2,21 +2,63 @@
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from collections.abc import Iterator
 
 from argviz.model import GraphModel
 from argviz.styles import StyleRegistry, NodeStyle, EdgeStyle, truncate_label
 
+# Fixed preamble emitted before any nodes
+_HEADER_LINES = (
+    "digraph argument_graph {",
+    "    // Graph settings",
+    "    rankdir=BT;",
+    "    splines=ortho;",
+    "    nodesep=0.6;",
+    "    ranksep=0.8;",
+    "    bgcolor=white;",
+    "",
+    "    // Node defaults",
+    '    node [fontname="Helvetica", fontsize=10];',
+    '    edge [fontname="Helvetica", fontsize=9];',
+    "",
+)
+
+# What _iter_lines yields for a graph with no nodes or links
+_EMPTY_DOT = "\n".join((
+    *_HEADER_LINES,
+    "    // Content nodes",
+    "",
+    "    // Link nodes",
+    "",
+    "    // Link edges",
+    "",
+    "}",
+))
+
+# Backslash, double quote and newline escapes for quoted DOT strings
+_DOT_ESCAPES = {"\\": "\\\\", '"': '\\"', "\n": "\\n"}
+_DOT_ESCAPE_PATTERN = re.compile(r'[\\"\n]')
+
+
+def _escape_dot_string(text: str) -> str:
+    """Escape backslashes, double quotes and newlines in one pass."""
+    if '"' not in text and "\\" not in text and "\n" not in text:
+        return text
+    return _DOT_ESCAPE_PATTERN.sub(lambda m: _DOT_ESCAPES[m.group()], text)
+
 
 def _escape_label(text: str, max_width: int = 25) -> str:
     """Escape and wrap label text for DOT format."""
     # Escape special characters
-    text = text.replace("\\", "\\\\")
-    text = text.replace('"', '\\"')
-    text = text.replace("\n", "\\n")
+    text = _escape_dot_string(text)
 
     # Wrap long lines
     words = text.split()
+    if len(text) < max_width:
+        # Fits on one line; collapsing whitespace is all the loop would do
+        return " ".join(words)
+
     lines = []
     current_line = []
     current_length = 0
@@ -43,58 +85,50 @@ def _quote_id(node_id: str) -> str:
     (hyphens, spaces, dots, etc.) or starting with digits.
     We always quote for safety and consistency.
     """
+    if '"' not in node_id:
+        return f'"{node_id}"'
     # Escape any quotes in the ID itself
     escaped = node_id.replace('"', '\\"')
     return f'"{escaped}"'
 
 
-def _format_node_attrs(node_id: str, style: NodeStyle, label: str) -> str:
-    """Format node attributes for DOT."""
-    quoted_id = _quote_id(node_id)
-    attrs = [
-        f'label="{label}"',
-        f'shape={style.shape}',
-        'style=filled',
-        f'fillcolor="{style.fill_color}"',
-        f'color="{style.border_color}"',
-    ]
+def _format_node_attrs(quoted_id: str, style: NodeStyle, label: str) -> str:
+    """Format node attributes for DOT.
 
+    Args:
+        quoted_id: Node ID already quoted with _quote_id.
+        style: Node style to use.
+        label: Escaped label text.
+    """
     if style.fixed_size and style.width and style.height:
-        attrs.extend([
-            f'width={style.width}',
-            f'height={style.height}',
-            'fixedsize=true',
-        ])
-
-    return f'    {quoted_id} [{", ".join(attrs)}];'
-
-
-def _format_edge(
-    source: str,
-    target: str,
+        return (
+            f'    {quoted_id} [label="{label}", shape={style.shape}, style=filled, '
+            f'fillcolor="{style.fill_color}", color="{style.border_color}", '
+            f'width={style.width}, height={style.height}, fixedsize=true];'
+        )
+    return (
+        f'    {quoted_id} [label="{label}", shape={style.shape}, style=filled, '
+        f'fillcolor="{style.fill_color}", color="{style.border_color}"];'
+    )
+
+
+def _format_edge_attrs(
     style: EdgeStyle,
     line_style_override: str | None = None,
 ) -> str:
-    """Format an edge with styling for DOT.
+    """Format the bracketed attribute list for an edge in DOT.
+
+    Every edge through a link shares its style, so this is computed once per
+    link and reused for each of the link's edges.
 
     Args:
-        source: Source node ID.
-        target: Target node ID.
         style: Edge style to use.
         line_style_override: Optional override for line style (e.g., "dashed" for auxiliary edges).
     """
-    quoted_source = _quote_id(source)
-    quoted_target = _quote_id(target)
-
     line_style = line_style_override or style.line_style
-    attrs = [
-        f'color="{style.line_color}"',
-        f'penwidth={style.line_width}',
-    ]
     if line_style != "solid":
-        attrs.append(f'style={line_style}')
-
-    return f'    {quoted_source} -> {quoted_target} [{", ".join(attrs)}];'
+        return f'[color="{style.line_color}", penwidth={style.line_width}, style={line_style}]'
+    return f'[color="{style.line_color}", penwidth={style.line_width}]'
 
 
 class DOTExporter:
@@ -117,60 +151,69 @@ class DOTExporter:
         Returns:
             DOT format string.
         """
-        lines = [
-            "digraph argument_graph {",
-            "    // Graph settings",
-            "    rankdir=BT;",
-            "    splines=ortho;",
-            "    nodesep=0.6;",
-            "    ranksep=0.8;",
-            "    bgcolor=white;",
-            "",
-            "    // Node defaults",
-            '    node [fontname="Helvetica", fontsize=10];',
-            '    edge [fontname="Helvetica", fontsize=9];',
-            "",
-        ]
+        if not model.nodes and not model.links:
+            return _EMPTY_DOT
+        return "\n".join(self._iter_lines(model))
+
+    def _iter_lines(self, model: GraphModel) -> Iterator[str]:
+        """Yield the lines of the DOT document in order."""
+        yield from _HEADER_LINES
+
+        # Quote each ID once; IDs recur as edge endpoints
+        quoted = {node_id: _quote_id(node_id) for node_id in model.nodes}
+        quoted.update({link_id: _quote_id(link_id) for link_id in model.links})
 
         # Add content nodes (Propositions and Datums)
-        lines.append("    // Content nodes")
+        yield "    // Content nodes"
+        max_label_chars = self.styles.max_label_chars
+        labels: dict[str, str] = {}  # content -> escaped label; content often repeats
         for node_id, node in model.nodes.items():
             style = self.styles.get_node_style(node)
             content = node.get("content", node_id)
-            truncated_content, _ = truncate_label(content, self.styles.max_label_chars)
-            label = _escape_label(truncated_content)
-            lines.append(_format_node_attrs(node_id, style, label))
-        lines.append("")
+            label = labels.get(content)
+            if label is None:
+                truncated_content, _ = truncate_label(content, max_label_chars)
+                label = labels[content] = _escape_label(truncated_content)
+            yield _format_node_attrs(quoted[node_id], style, label)
+        yield ""
 
         # Add link nodes
-        lines.append("    // Link nodes")
+        yield "    // Link nodes"
         for link_id, link in model.links.items():
             style = self.styles.get_node_style(link, is_link=True)
-            lines.append(_format_node_attrs(link_id, style, ""))
-        lines.append("")
+            yield _format_node_attrs(quoted[link_id], style, "")
+        yield ""
+
+        # Sources drawn with dashed edges; a node may feed many links
+        auxiliary_ids = {
+            node_id for node_id, node in model.nodes.items() if node.get("auxiliary", False)
+        }
 
         # Add edges from links
-        lines.append("    // Link edges")
+        yield "    // Link edges"
         for link_id, link in model.links.items():
             edge_style = self.styles.get_link_edge_style(link)
+            edge_attrs = _format_edge_attrs(edge_style)
+            auxiliary_attrs: str | None = None
+            quoted_link = quoted[link_id]
 
             # Edges from sources to link
             for source_id in link.get("source_ids", []):
-                # Use dashed line for edges from auxiliary nodes
-                source_node = model.nodes.get(source_id, {})
-                is_auxiliary = source_node.get("auxiliary", False)
-                line_style_override = "dashed" if is_auxiliary else None
-                lines.append(_format_edge(source_id, link_id, edge_style, line_style_override))
+                if source_id in auxiliary_ids:
+                    # Use dashed line for edges from auxiliary nodes
+                    if auxiliary_attrs is None:
+                        auxiliary_attrs = _format_edge_attrs(edge_style, "dashed")
+                    yield f"    {quoted[source_id]} -> {quoted_link} {auxiliary_attrs};"
+                else:
+                    yield f"    {quoted[source_id]} -> {quoted_link} {edge_attrs};"
 
             # Edge from link to target
             target_id = link.get("target_id")
             if target_id:
-                lines.append(_format_edge(link_id, target_id, edge_style))
-        lines.append("")
-
-        lines.append("}")
+                yield f"    {quoted_link} -> {quoted[target_id]} {edge_attrs};"
+        yield ""
 
-        return "\n".join(lines)
+        yield "}"
 
     def export_to_file(self, model: GraphModel, filepath: str) -> None:
         """Export graph to a DOT file.
@@ -179,6 +222,8 @@ class DOTExporter:
             model: The argument graph to export.
             filepath: Output file path.
         """
-        dot_content = self.export(model)
-        with open(filepath, "w") as f:
-            f.write(dot_content)
+        lines = self._iter_lines(model)
+        with open(filepath, "w", buffering=1 << 16) as f:
+            # Same separators as export(): no trailing newline
+            f.write(next(lines))
+            f.writelines("\n" + line for line in lines)
@@ -2,16 +2,44 @@
 
 from __future__ import annotations
 
+import itertools
 import re
 import secrets
+import sys
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 from argviz.model import GraphModel
 
 
+# Process-wide ID sequence. Seeded randomly once so IDs from separate parses
+# don't collide, without an os.urandom call per generated ID.
+_id_sequence = itertools.count(secrets.randbits(32))
+
+
+def _next_id_suffix() -> str:
+    """Return the next 8-hex-digit suffix for a generated node or link ID."""
+    return f"{next(_id_sequence) & 0xFFFFFFFF:08x}"
+
+
+# Bracket labels repeat on nearly every line; map each to one shared string so
+# nodes and links don't each hold a fresh slice of the line
+_LABELS = {
+    label: label
+    for label in ("supports", "undermines", "warrant", "Conclusion", "Proposition", "Datum")
+}
+
+
+def _intern_label(label: str) -> str:
+    """Return the shared instance of a polarity or node type label."""
+    return _LABELS.get(label) or sys.intern(label)
+
+
 class OutlineParseError(Exception):
     """Raised when outline parsing fails."""
 
@@ -21,9 +49,12 @@ class OutlineParseError(Exception):
         super().__init__(f"Line {line_number}: {message}")
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedLine:
-    """A parsed outline line."""
+    """A parsed outline line.
+
+    Slotted: relation and warrant lines are held until every node exists.
+    """
 
     line_number: int
     indent_level: int
@@ -35,10 +66,45 @@ class ParsedLine:
     is_warrant: bool
 
 
+# Single-pass line scanner: indent + number + [bracket] + optional [bracket] +
+# content, where content may be a back-reference like "(see 1.2)". Possessive
+# quantifiers (*+, ++) mark runs that can never need to give characters back,
+# so malformed lines fail fast instead of backtracking. Private: unlike
+# OutlineParser.LINE_PATTERN it doesn't capture the indentation, so its groups
+# are numbered differently.
+_LINE_RE = re.compile(
+    r'^\s*+'                                 # Indentation (width is where group 1 starts)
+    r'(\d++(?:\.\d++)*+(?:w\d++)?+)'         # Group 1: number (e.g., "1.1.2" or "1.1w1")
+    r'\.?\s+'                                # Optional period (for conclusions), whitespace
+    r'\[([^\]]++)\]'                         # Group 2: first bracket
+    r'(?:\s+\[([^\]]++)\])?'                 # Group 3: optional second bracket
+    r'\s+'                                   # Whitespace
+    r'(\(see\s++(\d++(?:\.\d++)*+)\)$|.+$)'  # Group 4: content; group 5: back-reference number
+)
+_match_line = _LINE_RE.match
+
+@lru_cache(maxsize=4096)
+def _parent_number(number: str) -> str | None:
+    """Compute the parent of an outline number; see OutlineParser._get_parent_number.
+
+    Cached because each number is looked up again as a parent, grandparent and
+    warrant target while links are resolved.
+    """
+    # Handle warrant numbers like "1.2w1" -> parent is "1.2"
+    if 'w' in number:
+        return number.split('w')[0]
+
+    parts = number.split('.')
+    if len(parts) <= 1:
+        return None
+    return '.'.join(parts[:-1])
+
+
 class OutlineParser:
     """Parse hierarchical outline format back into argument graphs."""
 
-    # Regex for standard lines: indent + number + [bracket] + optional [bracket] + content
+    # Regex for standard lines. Parsing uses _LINE_RE, which numbers its
+    # groups differently; this keeps the documented group layout for callers
     LINE_PATTERN = re.compile(
         r'^(\s*)'                           # Group 1: indentation
         r'(\d+(?:\.\d+)*(?:w\d+)?)'          # Group 2: number (e.g., "1.1.2" or "1.1w1")
@@ -49,7 +115,8 @@ class OutlineParser:
         r'(.+)$'                             # Group 5: content or back-reference
     )
 
-    # Regex for back-reference content
+    # Regex for back-reference content. Kept for callers; parsing matches
+    # back-references inside _LINE_RE instead
     BACKREF_PATTERN = re.compile(r'^\(see\s+(\d+(?:\.\d+)*)\)$')
 
     def _parse_line(self, line: str, line_number: int) -> ParsedLine:
@@ -65,20 +132,21 @@ class OutlineParser:
         Raises:
             OutlineParseError: If line is malformed.
         """
-        match = self.LINE_PATTERN.match(line)
+        match = _match_line(line)
         if not match:
             raise OutlineParseError(line_number, f"Malformed line: '{line}'")
 
-        indent_str, number, bracket1, bracket2, content_or_ref = match.groups()
+        number, bracket1, bracket2, content, backref = match.groups()
 
-        # Validate indentation
-        indent_len = len(indent_str)
-        if indent_len % 3 != 0:
+        # Validate indentation; the number starts right after it, so its
+        # offset is the indent width without slicing the indent out
+        indent_width = match.start(1)
+        indent_level, remainder = divmod(indent_width, 3)
+        if remainder:
             raise OutlineParseError(
                 line_number,
-                f"Invalid indentation: expected multiple of 3 spaces, got {indent_len}"
+                f"Invalid indentation: expected multiple of 3 spaces, got {indent_width}"
             )
-        indent_level = indent_len // 3
 
         # Determine if this is a warrant (has 'w' in number)
         is_warrant = 'w' in number
@@ -87,22 +155,17 @@ class OutlineParser:
         # For conclusions: bracket1 = "Conclusion", bracket2 = None
         # For others: bracket1 = polarity, bracket2 = type
         if bracket1 == "Conclusion":
+            # Conclusions never carry back-references; keep the text verbatim
             polarity = None
             node_type = "Conclusion"
-            content = content_or_ref
             backref = None
         else:
-            polarity = bracket1
-            node_type = bracket2 if bracket2 else "Proposition"
-
-            # Check if content is a back-reference
-            backref_match = self.BACKREF_PATTERN.match(content_or_ref)
-            if backref_match:
-                backref = backref_match.group(1)
+            polarity = _intern_label(bracket1)
+            node_type = _intern_label(bracket2) if bracket2 else "Proposition"
+            # "(see X)" was already recognized by the same match that split the
+            # line, so the content never needs a second scan
+            if backref is not None:
                 content = None
-            else:
-                backref = None
-                content = content_or_ref
 
         return ParsedLine(
             line_number=line_number,
@@ -124,14 +187,7 @@ class OutlineParser:
         Returns:
             The parent number (e.g., "1.2" for "1.2.3") or None for root.
         """
-        # Handle warrant numbers like "1.2w1" -> parent is "1.2"
-        if 'w' in number:
-            return number.split('w')[0]
-
-        parts = number.split('.')
-        if len(parts) <= 1:
-            return None
-        return '.'.join(parts[:-1])
+        return _parent_number(number)
 
     def parse(self, text: str) -> GraphModel:
         """Parse an outline string into a GraphModel.
@@ -145,67 +201,62 @@ class OutlineParser:
         Raises:
             OutlineParseError: If parsing fails.
         """
-        # Parse all non-empty lines
-        lines = text.split('\n')
-        parsed_lines: list[ParsedLine] = []
-
-        for i, line in enumerate(lines, start=1):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            parsed = self._parse_line(line, i)
-            parsed_lines.append(parsed)
-
-        if not parsed_lines:
-            return GraphModel({"nodes": [], "links": [], "edges": []})
+        return self._parse_lines(text.split('\n'))
 
+    def _parse_lines(self, lines: Iterable[str]) -> GraphModel:
+        """Parse outline lines, without line terminators, into a GraphModel."""
         # Maps outline number -> node_id
         number_to_node_id: dict[str, str] = {}
 
         # Build nodes and links
         nodes: list[dict[str, Any]] = []
+        warrant_nodes: list[dict[str, Any]] = []
         links: list[dict[str, Any]] = []
         edges: list[dict[str, Any]] = []
 
-        # First pass: create nodes for all non-backref, non-warrant lines
-        for parsed in parsed_lines:
-            if parsed.backref is not None:
-                # Back-references don't create new nodes
-                continue
-            if parsed.is_warrant:
-                # Warrants handled separately in fourth pass
-                continue
+        # Lines whose links are resolved once every node is known
+        # (back-references and parent lookups may point forward)
+        relation_lines: list[ParsedLine] = []
+        warrant_lines: list[ParsedLine] = []
 
-            # Generate unique node ID
-            node_id = f"node_{secrets.token_hex(4)}"
-            number_to_node_id[parsed.number] = node_id
+        # Bound methods used once or more per line, looked up once per parse
+        parse_line = self._parse_line
+        node_id_for = number_to_node_id.get
+        add_link = links.append
 
-            node = {
-                "id": node_id,
-                "type": parsed.node_type,
-                "content": parsed.content,
-            }
-            nodes.append(node)
+        # Single pass: parse each non-empty line, create its node, and queue it
+        # for link resolution. Warrant nodes are listed after all others.
+        for i, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            parsed = parse_line(line, i)
+
+            if parsed.is_warrant:
+                warrant_lines.append(parsed)
+                node_list = warrant_nodes
+            else:
+                if parsed.node_type != "Conclusion":
+                    # Conclusions have no parent to link to
+                    relation_lines.append(parsed)
+                node_list = nodes
 
-        # Also create warrant nodes
-        for parsed in parsed_lines:
             if parsed.backref is not None:
-                continue
-            if not parsed.is_warrant:
+                # Back-references don't create new nodes
                 continue
 
-            # Generate unique node ID for warrant
-            node_id = f"node_{secrets.token_hex(4)}"
+            # Generate unique node ID
+            node_id = f"node_{_next_id_suffix()}"
             number_to_node_id[parsed.number] = node_id
 
-            node = {
+            node_list.append({
                 "id": node_id,
                 "type": parsed.node_type,
                 "content": parsed.content,
-            }
-            nodes.append(node)
+            })
 
-        # Second pass: determine links and co-premises
+        nodes.extend(warrant_nodes)
+
+        # Resolve single-source links and co-premise groups
         # Co-premise detection: items whose parent number DOESN'T exist as a node
         # are co-premises targeting their grandparent.
         # Items whose parent EXISTS as a node are single-source links (created immediately).
@@ -214,33 +265,30 @@ class OutlineParser:
         #          -> they are co-premises targeting "1.1"
         #          1.1, 1.2 have parent "1" which exists -> separate links to "1"
 
-        # Key: (grandparent_number, polarity) -> list of parsed lines (for co-premises only)
-        copremise_groups: dict[tuple[str, str], list[ParsedLine]] = defaultdict(list)
-        # Track number_to_link_id for warrant targeting (built during link creation)
+        # Key: (parent_number, polarity) -> (target node ID, first source's number,
+        # source node IDs), for co-premises only. Targets and sources are resolved
+        # here once rather than again when the group's link is created.
+        copremise_groups: dict[tuple[str, str], tuple[str, str, list[str]]] = {}
+        # Track number_to_link_id for warrant targeting (built during link creation).
+        # Most outlines have no warrants, in which case nothing is tracked.
         number_to_link_id: dict[str, str] = {}
+        has_warrants = bool(warrant_lines)
 
-        for parsed in parsed_lines:
-            # Skip conclusions (they have no parent to link to)
-            if parsed.node_type == "Conclusion":
-                continue
-            # Skip warrants (handled in fourth pass)
-            if parsed.is_warrant:
-                continue
-
-            parent_number = self._get_parent_number(parsed.number)
+        for parsed in relation_lines:
+            parent_number = _parent_number(parsed.number)
             if parent_number is None:
                 continue
 
             # Determine the source node
             if parsed.backref is not None:
-                source_node_id = number_to_node_id.get(parsed.backref)
+                source_node_id = node_id_for(parsed.backref)
                 if source_node_id is None:
                     raise OutlineParseError(
                         parsed.line_number,
                         f"Back-reference '{parsed.backref}' not found"
                     )
             else:
-                source_node_id = number_to_node_id.get(parsed.number)
+                source_node_id = node_id_for(parsed.number)
 
             if source_node_id is None:
                 continue
@@ -254,20 +302,21 @@ class OutlineParser:
 
                 # Create single-source link
                 polarity = parsed.polarity or "supports"
-                link_id = f"link_{secrets.token_hex(4)}"
+                link_id = f"link_{_next_id_suffix()}"
                 link = {
                     "id": link_id,
                     "source_ids": [source_node_id],
                     "target_id": target_node_id,
                     "polarity": polarity,
                 }
-                links.append(link)
+                add_link(link)
                 # Track for warrant targeting
-                number_to_link_id[parsed.number] = link_id
+                if has_warrants:
+                    number_to_link_id[parsed.number] = link_id
             else:
                 # Parent doesn't exist -> this is a co-premise
                 # Target is the grandparent (parent of parent)
-                grandparent = self._get_parent_number(parent_number)
+                grandparent = _parent_number(parent_number)
                 if grandparent is None:
                     continue
                 if grandparent not in number_to_node_id:
@@ -278,66 +327,46 @@ class OutlineParser:
                 # e.g., 1.2.1.x and 1.2.2.x are different groups even though they share grandparent 1.2
                 polarity = parsed.polarity or "supports"
                 key = (parent_number, polarity)
-                copremise_groups[key].append(parsed)
-
-        # Third pass: create links from co-premise groups (multiple sources per link)
-        for (parent_number, polarity), siblings in copremise_groups.items():
-            # The key is parent_number (which doesn't exist as a node), so target is grandparent
-            grandparent = self._get_parent_number(parent_number)
-            if grandparent is None:
-                continue
-            target_node_id = number_to_node_id.get(grandparent)
-            if target_node_id is None:
-                continue
-
-            # Collect all source node IDs for this group
-            source_ids: list[str] = []
-            first_source_number: str | None = None
-
-            for parsed in siblings:
-                if parsed.backref is not None:
-                    source_node_id = number_to_node_id.get(parsed.backref)
+                group = copremise_groups.get(key)
+                if group is None:
+                    copremise_groups[key] = (
+                        number_to_node_id[grandparent], parsed.number, [source_node_id]
+                    )
                 else:
-                    source_node_id = number_to_node_id.get(parsed.number)
-
-                if source_node_id is not None:
-                    source_ids.append(source_node_id)
-                    if first_source_number is None:
-                        first_source_number = parsed.number
+                    group[2].append(source_node_id)
 
-            if not source_ids:
-                continue
+        # Create links from co-premise groups (multiple sources per link)
+        for (_, polarity), group in copremise_groups.items():
+            target_node_id, first_source_number, source_ids = group
 
             # Create a single link with all sources
-            link_id = f"link_{secrets.token_hex(4)}"
+            link_id = f"link_{_next_id_suffix()}"
             link = {
                 "id": link_id,
                 "source_ids": source_ids,
                 "target_id": target_node_id,
                 "polarity": polarity,
             }
-            links.append(link)
+            add_link(link)
 
             # Store link_id keyed by first source's number for warrant targeting
-            if first_source_number is not None:
+            if has_warrants:
                 number_to_link_id[first_source_number] = link_id
 
-        # Fourth pass: create warrant links (must come after regular links exist)
-        for parsed in parsed_lines:
-            if not parsed.is_warrant:
-                continue
+        # Create warrant links (must come after regular links exist)
+        for parsed in warrant_lines:
             if parsed.backref is not None:
                 # Back-reference warrants - source is the referenced node
-                source_node_id = number_to_node_id.get(parsed.backref)
+                source_node_id = node_id_for(parsed.backref)
             else:
-                source_node_id = number_to_node_id.get(parsed.number)
+                source_node_id = node_id_for(parsed.number)
 
             if source_node_id is None:
                 continue
 
             # Warrants target the link whose first source matches their parent number
             # e.g., 1.1w1 targets link from 1.1
-            parent_number = self._get_parent_number(parsed.number)
+            parent_number = _parent_number(parsed.number)
             if parent_number is None:
                 continue
 
@@ -346,14 +375,14 @@ class OutlineParser:
                 continue
 
             # Create warrant link targeting the link
-            warrant_link_id = f"link_{secrets.token_hex(4)}"
+            warrant_link_id = f"link_{_next_id_suffix()}"
             warrant_link = {
                 "id": warrant_link_id,
                 "source_ids": [source_node_id],
                 "target_id": target_link_id,
                 "polarity": "supports",  # Warrants support the inference
             }
-            links.append(warrant_link)
+            add_link(warrant_link)
 
         return GraphModel({"nodes": nodes, "links": links, "edges": edges})
 
@@ -370,9 +399,25 @@ class OutlineParser:
             OutlineParseError: If the outline is malformed.
             FileNotFoundError: If the file doesn't exist.
         """
+        # Stream lines rather than holding the whole text and its split copy
         with open(path) as f:
-            text = f.read()
-        return self.parse(text)
+            return self._parse_lines(line.rstrip('\n') for line in f)
+
+
+# Indentation strings for the common nesting depths
+_INDENTS = tuple("   " * level for level in range(64))
+
+
+def _indent(level: int) -> str:
+    """Return the indentation string for an outline nesting level."""
+    if level < len(_INDENTS):
+        return _INDENTS[level]
+    return "   " * level
+
+
+def _link_sort_key(link: dict[str, Any]) -> tuple[str, str]:
+    """Order links by polarity, then ID."""
+    return (link.get("polarity", ""), link.get("id", ""))
 
 
 class OutlineExporter:
@@ -387,150 +432,127 @@ class OutlineExporter:
         Returns:
             Hierarchical numbered outline string.
         """
-        # Find all conclusions (root nodes)
+        # Every line, across and within conclusion sections, is separated
+        # by a blank line
+        return "\n\n".join(self._build_lines(model))
+
+    def _build_lines(self, model: GraphModel) -> list[str]:
+        """Return the outline lines in order, without separators."""
+        # Find all conclusions (root nodes), decorated with their sort key
         conclusions = [
-            (node_id, node)
+            (node.get("content", node_id), node_id)
             for node_id, node in model.nodes.items()
             if node.get("type") == "Conclusion"
         ]
 
-        # Sort for deterministic output
-        conclusions.sort(key=lambda x: x[1].get("content", x[0]))
+        # Sort for deterministic output; stable on the key alone, so conclusions
+        # with the same content keep model order
+        conclusions.sort(key=itemgetter(0))
 
         # Track first occurrence of each node for back-references
         self._node_registry: dict[str, str] = {}
 
-        sections = []
-        for i, (conclusion_id, conclusion) in enumerate(conclusions, start=1):
-            section = self._format_conclusion_tree(
-                model, conclusion_id, conclusion, str(i)
-            )
-            sections.append(section)
-
-        return "\n\n".join(sections)
-
-    def _format_conclusion_tree(
-        self,
-        model: GraphModel,
-        node_id: str,
-        node: dict[str, Any],
-        number: str,
-    ) -> str:
-        """Format a conclusion and its supporting tree."""
-        lines = []
-        content = node.get("content", node_id)
-        lines.append(f"{number}. [Conclusion] {content}")
-
-        # Register this node
-        self._node_registry[node_id] = number
-
-        child_index = 1
-
-        # Find incoming links (supporters/underminers)
-        incoming_links = model.get_incoming_links(node_id)
-
-        # Sort for deterministic output
-        incoming_links.sort(key=lambda lnk: (lnk.get("polarity", ""), lnk.get("id", "")))
-
-        for link in incoming_links:
-            child_number = f"{number}.{child_index}"
-            child_lines = self._format_link_subtree(model, link, child_number, indent=1)
-            lines.extend(child_lines)
-            child_index += 1
-
-        return "\n\n".join(lines)
-
-    def _format_link_subtree(
-        self,
-        model: GraphModel,
-        link: dict[str, Any],
-        number: str,
-        indent: int,
-    ) -> list[str]:
-        """Format a link and its source nodes."""
-        lines = []
-        polarity = link.get("polarity", "supports")
-        source_ids = link.get("source_ids", [])
-        link_id = link.get("id")
-
-        # Process each source node
-        for k, source_id in enumerate(source_ids):
-            if len(source_ids) > 1:
-                source_number = f"{number}.{k + 1}"
-            else:
-                source_number = number
-
-            # Check for back-reference
-            if source_id in self._node_registry:
-                existing_number = self._node_registry[source_id]
-                indent_str = "   " * indent
-                lines.append(f"{indent_str}{source_number} [{polarity}] (see {existing_number})")
-                continue
-
-            source_node = model.nodes.get(source_id)
-            if source_node:
-                line = self._format_node_line(source_node, source_id, polarity, source_number, indent)
-                lines.append(line)
-                self._node_registry[source_id] = source_number
-
-                # Recurse into this node's supporters
-                child_lines = self._get_children_lines(model, source_id, source_number, indent + 1)
-                lines.extend(child_lines)
-
-        # Add warrants (links that target this link)
-        if link_id:
-            warrant_lines = self._get_warrant_lines(model, link_id, number, indent)
-            lines.extend(warrant_lines)
-
-        return lines
-
-    def _get_warrant_lines(
-        self,
-        model: GraphModel,
-        link_id: str,
-        parent_number: str,
-        indent: int,
-    ) -> list[str]:
-        """Get formatted lines for warrants supporting a link."""
-        lines = []
-
-        # Find links that target this link (warrants)
-        warrant_links = [
-            lnk for lnk in model.links.values()
-            if lnk.get("target_id") == link_id
+        # Index links by target once; covers both supporters of a node and
+        # warrants of a link (whose target_id is a link ID)
+        self._incoming: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        for link in model.links.values():
+            target_id = link.get("target_id")
+            if target_id:
+                self._incoming[target_id].append(link)
+
+        # Sort each index list once for deterministic output
+        for target_links in self._incoming.values():
+            target_links.sort(key=_link_sort_key)
+
+        # Depth-first walk driven by an explicit stack instead of recursion, so
+        # deep graphs can't hit the interpreter's recursion limit. Tasks are
+        # pushed in reverse so they pop in output order, and back-references
+        # are checked when a task pops, i.e. in the same order they're printed.
+        # Each task is (kind, payload, number, indent, polarity).
+        out: list[str] = []
+        nodes = model.nodes
+        registry = self._node_registry
+        incoming = self._incoming
+        stack: list[tuple[str, Any, str, int, str | None]] = [
+            ("conclusion", conclusion_id, str(i), 0, None)
+            for i, (_, conclusion_id) in reversed(list(enumerate(conclusions, start=1)))
         ]
 
-        # Sort for deterministic output
-        warrant_links.sort(key=lambda lnk: (lnk.get("polarity", ""), lnk.get("id", "")))
+        def push_links(target_id: str, parent_number: str, indent: int) -> None:
+            # Supporters/underminers of a node, numbered by their sorted position
+            links = incoming.get(target_id, ())
+            for index in range(len(links) - 1, -1, -1):
+                stack.append(("link", links[index], f"{parent_number}.{index + 1}", indent, None))
 
-        warrant_index = 1
-        for warrant_link in warrant_links:
-            source_ids = warrant_link.get("source_ids", [])
-            for source_id in source_ids:
-                warrant_number = f"{parent_number}w{warrant_index}"
+        while stack:
+            kind, payload, number, indent, polarity = stack.pop()
 
+            # Branches ordered by how often each kind of task occurs
+            if kind == "source":
                 # Check for back-reference
-                if source_id in self._node_registry:
-                    existing_number = self._node_registry[source_id]
-                    indent_str = "   " * indent
-                    lines.append(f"{indent_str}{warrant_number} [warrant] (see {existing_number})")
-                    warrant_index += 1
+                existing_number = registry.get(payload)
+                if existing_number is not None:
+                    out.append(f"{_indent(indent)}{number} [{polarity}] (see {existing_number})")
                     continue
-
-                source_node = model.nodes.get(source_id)
+                source_node = nodes.get(payload)
                 if source_node:
-                    indent_str = "   " * indent
-                    node_type = source_node.get("type", "Proposition")
-                    content = source_node.get("content", source_id)
-                    lines.append(f"{indent_str}{warrant_number} [warrant] [{node_type}] {content}")
-                    self._node_registry[source_id] = warrant_number
+                    out.append(
+                        self._format_node_line(source_node, payload, polarity, number, indent)
+                    )
+                    registry[payload] = number
+                    push_links(payload, number, indent + 1)
+
+            elif kind == "link":
+                # Sources in order, then warrants (links that target this link)
+                link_id = payload.get("id")
+                if link_id and link_id in incoming:
+                    stack.append(("warrants", link_id, number, indent, None))
+                link_polarity = payload.get("polarity", "supports")
+                source_ids = payload.get("source_ids", [])
+                if len(source_ids) == 1:
+                    stack.append(("source", source_ids[0], number, indent, link_polarity))
+                else:
+                    for k in range(len(source_ids) - 1, -1, -1):
+                        stack.append(
+                            ("source", source_ids[k], f"{number}.{k + 1}", indent, link_polarity)
+                        )
+
+            elif kind == "warrants":
+                # Sources missing from the model are skipped without using up a
+                # warrant number; every other source (new or back-reference) takes one
+                warrant_tasks = []
+                warrant_index = 1
+                for warrant_link in incoming.get(payload, ()):
+                    for source_id in warrant_link.get("source_ids", []):
+                        if source_id in registry or nodes.get(source_id):
+                            warrant_number = f"{number}w{warrant_index}"
+                            warrant_tasks.append(
+                                ("warrant", source_id, warrant_number, indent, None)
+                            )
+                            warrant_index += 1
+                stack.extend(reversed(warrant_tasks))
+
+            elif kind == "warrant":
+                indent_str = _indent(indent)
+                # Check for back-reference
+                existing_number = registry.get(payload)
+                if existing_number is not None:
+                    out.append(f"{indent_str}{number} [warrant] (see {existing_number})")
+                    continue
+                source_node = nodes[payload]
+                node_type = source_node.get("type", "Proposition")
+                content = source_node.get("content", payload)
+                out.append(f"{indent_str}{number} [warrant] [{node_type}] {content}")
+                registry[payload] = number
+                push_links(payload, number, indent + 1)
 
-                    # Recurse into this warrant's supporters
-                    child_lines = self._get_children_lines(model, source_id, warrant_number, indent + 1)
-                    lines.extend(child_lines)
-                    warrant_index += 1
+            else:  # "conclusion"
+                content = nodes[payload].get("content", payload)
+                out.append(f"{number}. [Conclusion] {content}")
+                registry[payload] = number
+                push_links(payload, number, 1)
 
-        return lines
+        return out
 
     def _format_node_line(
         self,
@@ -541,34 +563,11 @@ class OutlineExporter:
         indent: int,
     ) -> str:
         """Format a single node line."""
-        indent_str = "   " * indent
+        indent_str = _indent(indent)
         node_type = node.get("type", "Proposition")
         content = node.get("content", node_id)
         return f"{indent_str}{number} [{polarity}] [{node_type}] {content}"
 
-    def _get_children_lines(
-        self,
-        model: GraphModel,
-        node_id: str,
-        parent_number: str,
-        indent: int,
-    ) -> list[str]:
-        """Get formatted lines for all children of a node."""
-        lines = []
-        child_index = 1
-
-        # Handle incoming links (supports/undermines)
-        incoming_links = model.get_incoming_links(node_id)
-        incoming_links.sort(key=lambda lnk: (lnk.get("polarity", ""), lnk.get("id", "")))
-
-        for link in incoming_links:
-            child_number = f"{parent_number}.{child_index}"
-            child_lines = self._format_link_subtree(model, link, child_number, indent)
-            lines.extend(child_lines)
-            child_index += 1
-
-        return lines
-
     def export_to_file(self, model: GraphModel, path: Path) -> None:
         """Export graph to a file.
 
@@ -576,6 +575,8 @@ class OutlineExporter:
             model: The argument graph to export.
             path: Output file path.
         """
-        content = self.export(model)
-        with open(path, "w") as f:
-            f.write(content)
+        lines = iter(self._build_lines(model))
+        with open(path, "w", buffering=1 << 16) as f:
+            # Same separators as export(): no trailing newline
+            f.write(next(lines, ""))
+            f.writelines("\n\n" + line for line in lines)
@@ -3,11 +3,103 @@
 from __future__ import annotations
 
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import IO
 
 from argviz.model import GraphModel
 from argviz.styles import StyleRegistry
 
 
+# Every SVG document Graphviz writes starts with this declaration
+_SVG_DOCUMENT_START = "<?xml"
+
+
+def _run_dot(
+    dot_content: str,
+    output_format: str = "svg",
+    stdout: IO[bytes] | None = None,
+) -> str:
+    """Run ``dot`` on the given input and return its output.
+
+    Args:
+        dot_content: DOT input (one or more graphs).
+        output_format: Graphviz output format, e.g. "svg" or "svgz".
+        stdout: Binary file to receive the output directly. If given,
+            nothing is captured and an empty string is returned.
+
+    Raises:
+        RuntimeError: If Graphviz is not installed or fails.
+    """
+    try:
+        result = subprocess.run(
+            ["dot", f"-T{output_format}"],
+            input=dot_content,
+            stdout=subprocess.PIPE if stdout is None else stdout,
+            stderr=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            "Graphviz not found. Install with: brew install graphviz"
+        )
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Graphviz error: {e.stderr}")
+
+    return result.stdout or ""
+
+
+@lru_cache(maxsize=64)
+def _render_svg(dot_content: str) -> str:
+    """Render a DOT document to SVG with Graphviz.
+
+    Cached on the DOT text, which already reflects both the model and its
+    styles, so re-exporting an unchanged graph skips the ``dot`` process.
+    Failures raise and are therefore never cached.
+
+    Args:
+        dot_content: DOT document to lay out and render.
+
+    Returns:
+        SVG format string.
+
+    Raises:
+        RuntimeError: If Graphviz is not installed or fails.
+    """
+    return _run_dot(dot_content)
+
+
+def _render_svg_batch(dot_contents: list[str]) -> list[str]:
+    """Render several DOT documents to SVG with a single ``dot`` process.
+
+    Graphviz lays out every graph in its input in turn and writes one SVG
+    document per graph, so the documents are concatenated on the way in and
+    split on their XML declarations on the way out.
+
+    Args:
+        dot_contents: DOT documents to lay out and render.
+
+    Returns:
+        SVG strings, in the same order as dot_contents.
+
+    Raises:
+        RuntimeError: If Graphviz is not installed or fails.
+    """
+    if len(dot_contents) < 2:
+        return [_render_svg(dot_content) for dot_content in dot_contents]
+
+    output = _run_dot("\n".join(dot_contents))
+    documents = [
+        _SVG_DOCUMENT_START + document
+        for document in output.split(_SVG_DOCUMENT_START)[1:]
+    ]
+    if len(documents) != len(dot_contents):
+        # Unexpected output shape; render one at a time instead
+        return [_render_svg(dot_content) for dot_content in dot_contents]
+    return documents
+
+
 class SVGExporter:
     """Export argument graphs to SVG format.
 
@@ -39,20 +131,72 @@ class SVGExporter:
         dot_exporter = DOTExporter(self.styles)
         dot_content = dot_exporter.export(model)
 
-        # Use Graphviz to render SVG directly
-        try:
-            result = subprocess.run(
-                ["dot", "-Tsvg"],
-                input=dot_content,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-        except FileNotFoundError:
-            raise RuntimeError(
-                "Graphviz not found. Install with: brew install graphviz"
-            )
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Graphviz error: {e.stderr}")
-
-        return result.stdout
+        # Use Graphviz to render SVG directly (cached per DOT document)
+        return _render_svg(dot_content)
+
+    def export_many(self, models: list[GraphModel]) -> list[str]:
+        """Export several graphs to SVG with a single Graphviz process.
+
+        Args:
+            models: The argument graphs to export.
+
+        Returns:
+            SVG format strings, one per model, in order.
+
+        Raises:
+            RuntimeError: If Graphviz is not installed.
+        """
+        from argviz.exporters.dot import DOTExporter
+        dot_exporter = DOTExporter(self.styles)
+        return _render_svg_batch([dot_exporter.export(model) for model in models])
+
+    def export_many_parallel(
+        self,
+        models: list[GraphModel],
+        max_workers: int | None = None,
+    ) -> list[str]:
+        """Export several graphs to SVG, laying them out concurrently.
+
+        Each graph gets its own Graphviz process, so layouts run on separate
+        cores. Threads are enough to drive them since the work happens in
+        ``dot`` rather than in Python.
+
+        Args:
+            models: The argument graphs to export.
+            max_workers: Maximum number of concurrent ``dot`` processes.
+                Uses the ThreadPoolExecutor default if None.
+
+        Returns:
+            SVG format strings, one per model, in order.
+
+        Raises:
+            RuntimeError: If Graphviz is not installed.
+        """
+        from argviz.exporters.dot import DOTExporter
+        dot_exporter = DOTExporter(self.styles)
+        dot_contents = [dot_exporter.export(model) for model in models]
+        if len(dot_contents) < 2:
+            return [_render_svg(dot_content) for dot_content in dot_contents]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_render_svg, dot_contents))
+
+    def export_to_file(self, model: GraphModel, filepath: str) -> None:
+        """Export graph to an SVG file.
+
+        Graphviz writes straight into the file, so the SVG is never held in
+        memory. A path ending in ``.svgz`` is written gzip-compressed.
+
+        Args:
+            model: The argument graph to export.
+            filepath: Output file path.
+
+        Raises:
+            RuntimeError: If Graphviz is not installed.
+        """
+        from argviz.exporters.dot import DOTExporter
+        dot_content = DOTExporter(self.styles).export(model)
+
+        output_format = "svgz" if str(filepath).endswith(".svgz") else "svg"
+        with open(filepath, "wb") as f:
+            _run_dot(dot_content, output_format, stdout=f)
@@ -43,6 +43,7 @@ from .filters import (
     filter_links_by_polarity,
     filter_by_base_rate,
     filter_nodes,
+    filter_nodes_with_textual_basis,
     filter_links,
 )
 
@@ -52,6 +53,8 @@ from .traversal import (
     get_descendants,
     get_depth,
     get_height,
+    compute_all_depths,
+    compute_all_heights,
     get_paths,
     get_shortest_path,
     get_subgraph,
@@ -68,12 +71,13 @@ from .analysis import (
     find_weakly_supported,
     check_acyclic,
     find_cycles,
+    find_all_cycles,
     find_isolated_nodes,
     get_links_targeting_links,
 )
 
 # Serialization
-from .serialize import graph_to_dict
+from .serialize import graph_to_bytes, graph_to_dict
 
 # Textual - source text grounding
 from .textual import (
@@ -104,12 +108,15 @@ __all__ = [
     "filter_links_by_polarity",
     "filter_by_base_rate",
     "filter_nodes",
+    "filter_nodes_with_textual_basis",
     "filter_links",
     # Traversal
     "get_ancestors",
     "get_descendants",
     "get_depth",
     "get_height",
+    "compute_all_depths",
+    "compute_all_heights",
     "get_paths",
     "get_shortest_path",
     "get_subgraph",
@@ -123,10 +130,12 @@ __all__ = [
     "find_weakly_supported",
     "check_acyclic",
     "find_cycles",
+    "find_all_cycles",
     "find_isolated_nodes",
     "get_links_targeting_links",
     # Serialization
     "graph_to_dict",
+    "graph_to_bytes",
     # Textual
     "get_textual_basis",
     "get_quoted_text",
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+from collections import deque
+from collections.abc import Iterable, Mapping, Sized
 from typing import TYPE_CHECKING, Any
 
 import networkx as nx
 
-from .traversal import _build_support_graph, get_ancestors
+from .traversal import _build_support_graph
 
 if TYPE_CHECKING:
     from argviz.model import GraphModel
@@ -16,6 +18,47 @@ NodeId = str
 LinkDict = dict[str, Any]
 
 
+def _longest_path_length(
+    succ: Mapping[NodeId, Iterable[NodeId]],
+    pred: Mapping[NodeId, Sized],
+) -> int:
+    """Count the edges on the longest path of a DAG given as adjacency maps.
+
+    Kahn's topological ordering with a running longest-distance per node,
+    over the raw adjacency dicts rather than through the NetworkX API.
+
+    Args:
+        succ: Successors of every node.
+        pred: Predecessors of every node (only their counts are used).
+
+    Returns:
+        Length of the longest path in edges, or -1 if the graph has a cycle.
+    """
+    in_degree = {node_id: len(preds) for node_id, preds in pred.items()}
+    ready = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
+    distance = dict.fromkeys(in_degree, 0)
+    visited = 0
+    longest = 0
+
+    while ready:
+        current = ready.popleft()
+        visited += 1
+        next_distance = distance[current] + 1
+        for succ_id in succ[current]:
+            if next_distance > distance[succ_id]:
+                distance[succ_id] = next_distance
+                if next_distance > longest:
+                    longest = next_distance
+            in_degree[succ_id] -= 1
+            if in_degree[succ_id] == 0:
+                ready.append(succ_id)
+
+    # Nodes on or behind a cycle never reach in-degree zero
+    if visited < len(in_degree):
+        return -1
+    return longest
+
+
 def compute_graph_stats(graph: GraphModel) -> dict[str, Any]:
     """Compute summary statistics for the graph.
 
@@ -28,25 +71,21 @@ def compute_graph_stats(graph: GraphModel) -> dict[str, Any]:
         - max_depth: Longest path from leaf to root
         - avg_supporters: Average number of supporters per non-leaf node
     """
-    # Count nodes by type
+    # Count nodes by type (a missing type counts as "Unknown")
     nodes_by_type: dict[str, int] = {}
-    for node in graph.nodes.values():
-        node_type = node.get("type", "Unknown")
-        nodes_by_type[node_type] = nodes_by_type.get(node_type, 0) + 1
+    for node_type, node_ids in graph.nodes_by_type().items():
+        node_type = "Unknown" if node_type is None else node_type
+        nodes_by_type[node_type] = nodes_by_type.get(node_type, 0) + len(node_ids)
 
-    # Count links by polarity
+    # Count links by polarity (a missing polarity counts as "unknown")
     links_by_polarity: dict[str, int] = {}
-    for link in graph.links.values():
-        polarity = link.get("polarity", "unknown")
-        links_by_polarity[polarity] = links_by_polarity.get(polarity, 0) + 1
+    for polarity, links in graph.links_by_polarity().items():
+        polarity = "unknown" if polarity is None else polarity
+        links_by_polarity[polarity] = links_by_polarity.get(polarity, 0) + len(links)
 
-    # Compute max depth (longest path)
+    # Compute max depth (longest path); -1 if the graph has cycles
     g = _build_support_graph(graph, support_only=True)
-    try:
-        max_depth = nx.dag_longest_path_length(g) if g.number_of_edges() > 0 else 0
-    except nx.NetworkXUnfeasible:
-        # Graph has cycles
-        max_depth = -1
+    max_depth = _longest_path_length(g.succ, g.pred)
 
     # Compute average supporters per non-leaf node
     supporter_counts = []
@@ -80,26 +119,30 @@ def find_ungrounded_claims(graph: GraphModel) -> list[NodeId]:
     Returns:
         List of Proposition node IDs with no Datum ancestors.
     """
-    result: list[NodeId] = []
-
     # Get all datum IDs
-    datum_ids = {
+    datum_ids = [
         node_id
         for node_id, node in graph.nodes.items()
         if node.get("type") == "Datum"
-    }
-
-    # Check each proposition
-    for node_id, node in graph.nodes.items():
-        if node.get("type") != "Proposition":
-            continue
+    ]
 
-        ancestors = set(get_ancestors(graph, node_id, support_only=True))
-        # Check if any ancestor is a datum
-        if not ancestors & datum_ids:
-            result.append(node_id)
+    # One forward walk from every datum marks everything with Datum ancestry,
+    # instead of an ancestor search per proposition
+    g = _build_support_graph(graph, support_only=True)
+    grounded: set[NodeId] = set()
+    stack = datum_ids
+    while stack:
+        current = stack.pop()
+        for succ in g.successors(current):
+            if succ not in grounded:
+                grounded.add(succ)
+                stack.append(succ)
 
-    return result
+    return [
+        node_id
+        for node_id, node in graph.nodes.items()
+        if node.get("type") == "Proposition" and node_id not in grounded
+    ]
 
 
 def find_weakly_supported(
@@ -139,7 +182,37 @@ def check_acyclic(graph: GraphModel) -> bool:
 
 
 def find_cycles(graph: GraphModel) -> list[list[NodeId]]:
-    """Find all cycles in the graph (circular reasoning).
+    """Find representative cycles in the graph (circular reasoning).
+
+    Returns one cycle per strongly connected component that contains a cycle,
+    which is enough to show where circular reasoning occurs and runs in
+    linear time. Use find_all_cycles to enumerate every elementary cycle.
+
+    Returns:
+        List of cycles, where each cycle is a list of node IDs.
+        Empty list if graph is acyclic.
+    """
+    g = _build_support_graph(graph, support_only=False)
+
+    cycles: list[list[NodeId]] = []
+    for component in nx.strongly_connected_components(g):
+        if len(component) == 1:
+            # A single node is only a cycle if it supports itself
+            node_id = next(iter(component))
+            if g.has_edge(node_id, node_id):
+                cycles.append([node_id])
+            continue
+        edges = nx.find_cycle(g.subgraph(component))
+        cycles.append([source_id for source_id, _ in edges])
+
+    return cycles
+
+
+def find_all_cycles(graph: GraphModel) -> list[list[NodeId]]:
+    """Find all elementary cycles in the graph (circular reasoning).
+
+    The number of elementary cycles can grow exponentially with graph size;
+    prefer find_cycles unless every cycle is needed.
 
     Returns:
         List of cycles, where each cycle is a list of node IDs.
@@ -163,13 +236,20 @@ def find_isolated_nodes(graph: GraphModel) -> list[NodeId]:
     Returns:
         List of node IDs with no connections.
     """
-    g = _build_support_graph(graph, support_only=False)
+    # One pass over the links instead of building the support graph. Like
+    # its edges, only node-to-node connections count (not links on links)
+    nodes = graph.nodes
+    touched: set[NodeId] = set()
+    for link in graph.links.values():
+        target_id = link.get("target_id")
+        if not target_id or target_id not in nodes:
+            continue
+        sources = [source_id for source_id in link.get("source_ids", []) if source_id in nodes]
+        if sources:
+            touched.update(sources)
+            touched.add(target_id)
 
-    return [
-        node_id
-        for node_id in graph.nodes
-        if g.in_degree(node_id) == 0 and g.out_degree(node_id) == 0
-    ]
+    return [node_id for node_id in nodes if node_id not in touched]
 
 
 def get_links_targeting_links(graph: GraphModel) -> list[LinkDict]:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any, Literal
 
@@ -32,7 +33,19 @@ def filter_by_type(
     if isinstance(node_types, str):
         node_types = [node_types]
 
-    type_set = set(node_types)
+    by_type = graph.nodes_by_type()
+    present = [by_type[node_type] for node_type in set(node_types) if node_type in by_type]
+    if len(present) <= 1:
+        # One matching type: its index list is already in model order
+        return list(present[0]) if present else []
+
+    # Several types: interleave in model order. Model types are interned
+    # (see GraphModel), so interned keys compare by identity; anything that
+    # isn't a string is matched as-is
+    type_set = {
+        sys.intern(node_type) if isinstance(node_type, str) else node_type
+        for node_type in node_types
+    }
     return [
         node_id
         for node_id, node in graph.nodes.items()
@@ -53,11 +66,7 @@ def filter_links_by_polarity(
     Returns:
         List of Link dicts matching the polarity.
     """
-    return [
-        link
-        for link in graph.links.values()
-        if link.get("polarity") == polarity
-    ]
+    return list(graph.links_by_polarity().get(polarity, ()))
 
 
 def filter_by_base_rate(
@@ -78,21 +87,20 @@ def filter_by_base_rate(
     Returns:
         List of node IDs with base_rate in the specified range.
     """
-    result: list[NodeId] = []
-
-    for node_id, node in graph.nodes.items():
-        base_rate = node.get("base_rate")
-        if base_rate is None:
-            continue
-
-        if min_rate is not None and base_rate < min_rate:
-            continue
-        if max_rate is not None and base_rate > max_rate:
-            continue
-
-        result.append(node_id)
-
-    return result
+    # Only nodes with a base_rate are scanned, with the bound checks
+    # hoisted out of the loop
+    rates = graph.base_rates()
+    if min_rate is None and max_rate is None:
+        return list(rates)
+    if max_rate is None:
+        return [node_id for node_id, rate in rates.items() if not rate < min_rate]
+    if min_rate is None:
+        return [node_id for node_id, rate in rates.items() if not rate > max_rate]
+    return [
+        node_id
+        for node_id, rate in rates.items()
+        if not (rate < min_rate or rate > max_rate)
+    ]
 
 
 def filter_nodes(
@@ -108,12 +116,13 @@ def filter_nodes(
     Returns:
         List of node IDs where predicate returns True.
 
-    Examples:
-        # Nodes with textual basis
-        filter_nodes(graph, lambda n: n.get("textual_basis") is not None)
+    Prefer the dedicated filters (filter_by_type,
+    filter_nodes_with_textual_basis, ...) where one fits; they avoid a
+    Python call per node.
 
-        # Nodes without textual basis
-        filter_nodes(graph, lambda n: n.get("textual_basis") is None)
+    Examples:
+        # Nodes with a base_rate above 0.5
+        filter_nodes(graph, lambda n: (n.get("base_rate") or 0) > 0.5)
 
         # Leaf propositions
         leaves = set(get_leaves(graph))
@@ -126,6 +135,35 @@ def filter_nodes(
     ]
 
 
+def filter_nodes_with_textual_basis(
+    graph: GraphModel,
+    has_basis: bool = True,
+) -> list[NodeId]:
+    """Get nodes with (or without) a textual basis.
+
+    Equivalent to filter_nodes with a ``textual_basis`` predicate, without
+    the per-node function call.
+
+    Args:
+        graph: The argument graph.
+        has_basis: If False, return the nodes lacking a textual basis instead.
+
+    Returns:
+        List of node IDs, in model order.
+    """
+    if has_basis:
+        return [
+            node_id
+            for node_id, node in graph.nodes.items()
+            if node.get("textual_basis") is not None
+        ]
+    return [
+        node_id
+        for node_id, node in graph.nodes.items()
+        if node.get("textual_basis") is None
+    ]
+
+
 def filter_links(
     graph: GraphModel,
     predicate: Callable[[LinkDict], bool],
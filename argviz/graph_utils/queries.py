@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence, ValuesView
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
@@ -41,22 +42,42 @@ def get_link(graph: GraphModel, link_id: str) -> LinkDict | None:
     return graph.links.get(link_id)
 
 
-def get_all_nodes(graph: GraphModel) -> list[NodeDict]:
+def get_all_nodes(
+    graph: GraphModel,
+    as_list: bool = True,
+) -> list[NodeDict] | ValuesView[NodeDict]:
     """Get all nodes in the graph.
 
+    Args:
+        graph: The argument graph.
+        as_list: If False, return a live view of the nodes instead of a
+                 copy; cheaper when the caller only iterates.
+
     Returns:
-        List of all node dicts (Propositions, Datums, Conclusions).
+        List (or view) of all node dicts (Propositions, Datums, Conclusions).
     """
-    return list(graph.nodes.values())
+    if as_list:
+        return list(graph.nodes.values())
+    return graph.nodes.values()
 
 
-def get_all_links(graph: GraphModel) -> list[LinkDict]:
+def get_all_links(
+    graph: GraphModel,
+    as_list: bool = True,
+) -> list[LinkDict] | ValuesView[LinkDict]:
     """Get all links in the graph.
 
+    Args:
+        graph: The argument graph.
+        as_list: If False, return a live view of the links instead of a
+                 copy; cheaper when the caller only iterates.
+
     Returns:
-        List of all link dicts.
+        List (or view) of all link dicts.
     """
-    return list(graph.links.values())
+    if as_list:
+        return list(graph.links.values())
+    return graph.links.values()
 
 
 def has_node(graph: GraphModel, node_id: NodeId) -> bool:
@@ -82,12 +103,8 @@ def get_roots(graph: GraphModel) -> list[NodeId]:
     Returns:
         List of node IDs that are argumentative roots.
     """
-    # Collect all nodes that are sources in any link
-    sources: set[str] = set()
-    for link in graph.links.values():
-        sources.update(link.get("source_ids", []))
-
-    # Roots are nodes that are not sources
+    # Roots are nodes that are not sources of any link
+    sources = graph.links_by_source()
     return [node_id for node_id in graph.nodes if node_id not in sources]
 
 
@@ -100,16 +117,13 @@ def get_leaves(graph: GraphModel) -> list[NodeId]:
     Returns:
         List of node IDs that are argumentative leaves.
     """
-    # Collect all nodes that are targets of support links
-    targets: set[str] = set()
-    for link in graph.links.values():
-        if link.get("polarity") == "supports":
-            target_id = link.get("target_id")
-            if target_id and target_id in graph.nodes:
-                targets.add(target_id)
-
     # Leaves are nodes that are not targets of any support
-    return [node_id for node_id in graph.nodes if node_id not in targets]
+    by_target = graph.links_by_target()
+    return [
+        node_id
+        for node_id in graph.nodes
+        if not any(link.get("polarity") == "supports" for link in by_target.get(node_id, ()))
+    ]
 
 
 def get_related_nodes(
@@ -140,27 +154,52 @@ def get_related_nodes(
         # Get nodes this node supports
         get_related_nodes(graph, "P1", "outgoing", "supports")
     """
-    result: list[NodeId] = []
-
-    for link in graph.links.values():
-        # Filter by polarity if specified
-        if polarity is not None and link.get("polarity") != polarity:
-            continue
+    # Only this node's own links are visited, and direction and polarity
+    # are resolved once rather than per link. Dict keys keep first-seen order
+    links = _links_for_node(graph, node_id, direction, polarity)
+    nodes = graph.nodes
+
+    if direction == "incoming":
+        # Links targeting this node -> return their sources
+        related = {
+            source_id: None
+            for link in links
+            for source_id in link.get("source_ids", [])
+            if source_id in nodes
+        }
+    else:  # outgoing
+        # Links where this node is a source -> return their targets
+        related = {
+            target_id: None
+            for link in links
+            if (target_id := link.get("target_id")) and target_id in nodes
+        }
+
+    return list(related)
+
+
+def _links_for_node(
+    graph: GraphModel,
+    node_id: NodeId,
+    direction: Direction,
+    polarity: Polarity | None,
+) -> Sequence[LinkDict]:
+    """Select a node's links from the model's link indexes.
 
-        if direction == "incoming":
-            # Links targeting this node -> return their sources
-            if link.get("target_id") == node_id:
-                for source_id in link.get("source_ids", []):
-                    if source_id in graph.nodes and source_id not in result:
-                        result.append(source_id)
-        else:  # outgoing
-            # Links where this node is a source -> return their targets
-            if node_id in link.get("source_ids", []):
-                target_id = link.get("target_id")
-                if target_id and target_id in graph.nodes and target_id not in result:
-                    result.append(target_id)
+    Like get_links_for_node, but without polarity the index list itself is
+    returned rather than a copy; callers must not modify it.
+    """
+    if direction == "incoming":
+        # Links targeting this node
+        links = graph.links_by_target().get(node_id, ())
+    else:  # outgoing
+        # Links where this node is a source
+        links = graph.links_by_source().get(node_id, ())
 
-    return result
+    # Filter by polarity if specified
+    if polarity is None:
+        return links
+    return [link for link in links if link.get("polarity") == polarity]
 
 
 def get_links_for_node(
@@ -188,20 +227,4 @@ def get_links_for_node(
         # Get all outgoing links from this node
         get_links_for_node(graph, "P1", "outgoing", None)
     """
-    result: list[LinkDict] = []
-
-    for link in graph.links.values():
-        # Filter by polarity if specified
-        if polarity is not None and link.get("polarity") != polarity:
-            continue
-
-        if direction == "incoming":
-            # Links targeting this node
-            if link.get("target_id") == node_id:
-                result.append(link)
-        else:  # outgoing
-            # Links where this node is a source
-            if node_id in link.get("source_ids", []):
-                result.append(link)
-
-    return result
+    return list(_links_for_node(graph, node_id, direction, polarity))
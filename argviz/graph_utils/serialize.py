@@ -2,8 +2,16 @@
 
 from __future__ import annotations
 
+import datetime
+import json
+import math
 from typing import TYPE_CHECKING, Any
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from argviz.model import GraphModel
 
@@ -22,3 +30,49 @@ def graph_to_dict(graph: GraphModel) -> dict[str, Any]:
         "nodes": list(graph.nodes.values()),
         "links": list(graph.links.values()),
     }
+
+
+def _json_default(value: Any) -> Any:
+    """Encode dates and times for json as orjson does natively (ISO 8601)."""
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _finite(value: Any) -> Any:
+    """Replace NaN and infinities with None, as orjson writes them as null."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def graph_to_bytes(graph: GraphModel) -> bytes:
+    """Serialize GraphModel to compact UTF-8 JSON.
+
+    Uses orjson when installed, which is much faster on large graphs, and
+    produces the same bytes either way: dates and times are written as ISO
+    8601 strings and non-finite floats (e.g. a NaN base_rate) as null, so
+    the output is always valid JSON. Prefer this over graph_to_dict when the
+    result is only going to be written out.
+
+    Args:
+        graph: The argument graph.
+
+    Returns:
+        JSON document with 'nodes' and 'links' keys, as bytes.
+    """
+    data = graph_to_dict(graph)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    text = json.dumps(
+        _finite(data),
+        separators=(",", ":"),
+        ensure_ascii=False,
+        allow_nan=False,
+        default=_json_default,
+    )
+    return text.encode()
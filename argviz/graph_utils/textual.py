@@ -7,6 +7,7 @@ for the quoted text in the source document.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -17,24 +18,26 @@ NodeId = str
 TextualBasis = dict[str, Any] | list[dict[str, Any]] | None
 
 
-def _normalize_textual_basis(tb: Any) -> list[dict[str, Any]]:
-    """Normalize textual basis to a list of span dicts.
+def _normalize_textual_basis(tb: Any) -> Sequence[dict[str, Any]]:
+    """Normalize textual basis to a sequence of span dicts.
 
     TextualBasis can be:
     - None
     - A single dict with 'text' and optional 'location'
     - A list of such dicts
 
+    Called per node in the textual scans, so it avoids building lists: a
+    list is returned as-is, a single dict as a 1-tuple, and None as a
+    shared empty tuple.
+
     Returns:
-        List of span dicts, empty if None.
+        Sequence of span dicts, empty if None.
     """
-    if tb is None:
-        return []
     if isinstance(tb, list):
         return tb
     if isinstance(tb, dict):
-        return [tb]
-    return []
+        return (tb,)
+    return ()
 
 
 def get_textual_basis(graph: GraphModel, node_id: NodeId) -> TextualBasis:
@@ -109,6 +112,85 @@ def find_text_in_source(
     return (idx, idx + len(quoted_text))
 
 
+def _node_spans(
+    graph: GraphModel,
+    source_text: str,
+) -> dict[NodeId, list[tuple[int, int]]]:
+    """Locate every node's quoted texts in the source document.
+
+    Each distinct quote is searched for once, and the result is cached on
+    the model for this source text until the model changes, so successive
+    position/span/coverage queries share one scan. The mapping is shared
+    between callers; don't modify it.
+
+    Args:
+        graph: The argument graph.
+        source_text: The original source document.
+
+    Returns:
+        Dict mapping node ID to the (start, end) spans of its quoted texts
+        that occur in the source, in node and quote order. Nodes with no
+        located quote are omitted.
+    """
+    key = (graph._version, len(graph.nodes), source_text)
+    cached = graph._text_spans
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    positions: dict[str, tuple[int, int] | None] = {}
+    spans: dict[NodeId, list[tuple[int, int]]] = {}
+    for node_id, node in graph.nodes.items():
+        tb = node.get("textual_basis")
+        if tb is None:
+            continue
+        node_spans: list[tuple[int, int]] = []
+        for span in _normalize_textual_basis(tb):
+            quoted = span.get("text")
+            if not quoted:
+                continue
+            if quoted not in positions:
+                positions[quoted] = find_text_in_source(source_text, quoted)
+            position = positions[quoted]
+            if position:
+                node_spans.append(position)
+        if node_spans:
+            spans[node_id] = node_spans
+
+    graph._text_spans = (key, spans)
+    return spans
+
+
+def _merged_spans(graph: GraphModel, source_text: str) -> list[tuple[int, int]]:
+    """Merge all located node spans into sorted, non-overlapping ranges.
+
+    Shared by the coverage and gap computations so both sweep the same
+    merged ranges.
+
+    Returns:
+        Sorted list of (start, end) ranges; touching spans are joined.
+    """
+    spans = sorted(
+        span for node_spans in _node_spans(graph, source_text).values() for span in node_spans
+    )
+
+    if not spans:
+        return []
+
+    # Track the open range in locals; emit a tuple only when it closes
+    merged: list[tuple[int, int]] = []
+    current_start, current_end = spans[0]
+    for start, end in spans:
+        if start <= current_end:
+            # Overlaps with previous - extend it
+            if end > current_end:
+                current_end = end
+        else:
+            merged.append((current_start, current_end))
+            current_start, current_end = start, end
+    merged.append((current_start, current_end))
+    return merged
+
+
 def get_nodes_at_position(
     graph: GraphModel,
     source_text: str,
@@ -127,16 +209,11 @@ def get_nodes_at_position(
     Returns:
         List of node IDs whose grounded text contains this position.
     """
-    result: list[NodeId] = []
-
-    for node_id in graph.nodes:
-        for quoted in get_all_quoted_texts(graph, node_id):
-            span = find_text_in_source(source_text, quoted)
-            if span and span[0] <= position < span[1]:
-                result.append(node_id)
-                break  # Don't add same node twice
-
-    return result
+    return [
+        node_id
+        for node_id, spans in _node_spans(graph, source_text).items()
+        if any(start <= position < end for start, end in spans)
+    ]
 
 
 def get_nodes_in_span(
@@ -158,18 +235,12 @@ def get_nodes_in_span(
     Returns:
         List of node IDs with spans overlapping the range.
     """
-    result: list[NodeId] = []
-
-    for node_id in graph.nodes:
-        for quoted in get_all_quoted_texts(graph, node_id):
-            span = find_text_in_source(source_text, quoted)
-            if span:
-                # Check for overlap: not (span ends before range or range ends before span)
-                if not (span[1] <= start or end <= span[0]):
-                    result.append(node_id)
-                    break
-
-    return result
+    # Overlap: not (span ends before range or range ends before span)
+    return [
+        node_id
+        for node_id, spans in _node_spans(graph, source_text).items()
+        if any(not (span_end <= start or end <= span_start) for span_start, span_end in spans)
+    ]
 
 
 def compute_grounding_coverage(
@@ -188,32 +259,9 @@ def compute_grounding_coverage(
     if not source_text:
         return 0.0
 
-    source_length = len(source_text)
-
-    # Collect all spans
-    spans: list[tuple[int, int]] = []
-    for node_id in graph.nodes:
-        for quoted in get_all_quoted_texts(graph, node_id):
-            span = find_text_in_source(source_text, quoted)
-            if span:
-                spans.append(span)
-
-    if not spans:
-        return 0.0
-
-    # Merge overlapping spans to avoid double-counting
-    spans.sort()
-    merged: list[tuple[int, int]] = []
-    for start, end in spans:
-        if merged and start <= merged[-1][1]:
-            # Overlaps with previous - extend it
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-        else:
-            merged.append((start, end))
-
-    # Sum coverage
-    covered = sum(end - start for start, end in merged)
-    return covered / source_length
+    # Sum coverage; overlapping spans are merged so they count once
+    covered = sum(end - start for start, end in _merged_spans(graph, source_text))
+    return covered / len(source_text)
 
 
 def get_grounding_gaps(
@@ -236,28 +284,12 @@ def get_grounding_gaps(
 
     source_length = len(source_text)
 
-    # Collect and merge all spans
-    spans: list[tuple[int, int]] = []
-    for node_id in graph.nodes:
-        for quoted in get_all_quoted_texts(graph, node_id):
-            span = find_text_in_source(source_text, quoted)
-            if span:
-                spans.append(span)
-
-    if not spans:
+    merged = _merged_spans(graph, source_text)
+    if not merged:
         if source_length >= min_gap_size:
             return [(0, source_length)]
         return []
 
-    # Merge overlapping spans
-    spans.sort()
-    merged: list[tuple[int, int]] = []
-    for start, end in spans:
-        if merged and start <= merged[-1][1]:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
-        else:
-            merged.append((start, end))
-
     # Find gaps
     gaps: list[tuple[int, int]] = []
 
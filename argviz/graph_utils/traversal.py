@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
 from collections import deque
+from collections.abc import Iterable, Iterator, Mapping
 from typing import TYPE_CHECKING, Any
 
 import networkx as nx
@@ -16,10 +18,11 @@ PathList = list[NodeId]
 
 
 def _build_support_graph(graph: GraphModel, support_only: bool = True) -> nx.DiGraph:
-    """Build a NetworkX DiGraph of node-to-node relationships.
+    """Get the NetworkX DiGraph of node-to-node relationships.
 
     This flattens the reified link structure into direct edges between nodes,
-    optionally filtering to support relationships only.
+    optionally filtering to support relationships only. The result is cached
+    on the model and shared between calls, so it is frozen against edits.
 
     Args:
         graph: The argument graph.
@@ -28,6 +31,20 @@ def _build_support_graph(graph: GraphModel, support_only: bool = True) -> nx.DiG
     Returns:
         DiGraph with edges from source nodes to target nodes.
     """
+    # Entry counts catch added/removed nodes and links; in-place edits are
+    # signalled through GraphModel.mark_changed()
+    key = (graph._version, len(graph.nodes), len(graph.links))
+    cached = graph._support_graphs.get(support_only)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    g = nx.freeze(_make_support_graph(graph, support_only))
+    graph._support_graphs[support_only] = (key, g)
+    return g
+
+
+def _make_support_graph(graph: GraphModel, support_only: bool) -> nx.DiGraph:
+    """Build the DiGraph returned by _build_support_graph."""
     g = nx.DiGraph()
 
     # Add all nodes
@@ -48,6 +65,25 @@ def _build_support_graph(graph: GraphModel, support_only: bool = True) -> nx.DiG
     return g
 
 
+def _reachable(adjacency: Mapping[NodeId, Iterable[NodeId]], start: NodeId) -> set[NodeId]:
+    """Collect every node reachable from start through an adjacency map.
+
+    Iterative depth-first walk over the raw adjacency dicts (e.g. the
+    support graph's ``pred`` or ``succ``), without going through NetworkX.
+
+    Returns:
+        Reachable node IDs, excluding start unless it lies on a cycle.
+    """
+    seen: set[NodeId] = set()
+    stack = [start]
+    while stack:
+        for neighbor in adjacency[stack.pop()]:
+            if neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return seen
+
+
 def get_ancestors(
     graph: GraphModel,
     node_id: NodeId,
@@ -71,7 +107,9 @@ def get_ancestors(
         return []
 
     g = _build_support_graph(graph, support_only)
-    return list(nx.ancestors(g, node_id))
+    ancestors = _reachable(g.pred, node_id)
+    ancestors.discard(node_id)
+    return list(ancestors)
 
 
 def get_descendants(
@@ -97,7 +135,69 @@ def get_descendants(
         return []
 
     g = _build_support_graph(graph, support_only)
-    return list(nx.descendants(g, node_id))
+    descendants = _reachable(g.succ, node_id)
+    descendants.discard(node_id)
+    return list(descendants)
+
+
+def _levels(graph: GraphModel, direction: str) -> dict[NodeId, int]:
+    """Distance of every node from its nearest leaf ("depth") or root ("height").
+
+    One multi-source BFS from all leaves forward (or all roots backward)
+    over the support graph, instead of a BFS per node. Nodes that no leaf
+    (or root) reaches, i.e. ones only fed by cycles, get 0. Cached on the
+    model like the support graph; don't modify the result.
+    """
+    g = _build_support_graph(graph, support_only=True)
+    key = (graph._version, len(graph.nodes), len(graph.links))
+    cached = graph._levels.get(direction)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Depth starts at the leaves and walks edges forward; height starts at
+    # the roots and walks them backward
+    if direction == "depth":
+        start_adj, walk_adj = g.pred, g.succ
+    else:
+        start_adj, walk_adj = g.succ, g.pred
+
+    levels = {node_id: 0 for node_id, neighbors in start_adj.items() if not neighbors}
+    queue = deque(levels)
+    while queue:
+        current = queue.popleft()
+        next_level = levels[current] + 1
+        for neighbor in walk_adj[current]:
+            if neighbor not in levels:
+                levels[neighbor] = next_level
+                queue.append(neighbor)
+
+    for node_id in graph.nodes:
+        levels.setdefault(node_id, 0)
+
+    graph._levels[direction] = (key, levels)
+    return levels
+
+
+def compute_all_depths(graph: GraphModel) -> dict[NodeId, int]:
+    """Get the depth of every node in one pass.
+
+    Equivalent to calling get_depth for each node, in O(N+E) total.
+
+    Returns:
+        Dict mapping node ID to distance from its nearest leaf.
+    """
+    return dict(_levels(graph, "depth"))
+
+
+def compute_all_heights(graph: GraphModel) -> dict[NodeId, int]:
+    """Get the height of every node in one pass.
+
+    Equivalent to calling get_height for each node, in O(N+E) total.
+
+    Returns:
+        Dict mapping node ID to distance from its nearest root.
+    """
+    return dict(_levels(graph, "height"))
 
 
 def get_depth(graph: GraphModel, node_id: NodeId) -> int:
@@ -116,29 +216,7 @@ def get_depth(graph: GraphModel, node_id: NodeId) -> int:
     if node_id not in graph.nodes:
         return -1
 
-    g = _build_support_graph(graph, support_only=True)
-
-    # BFS from node going backward (toward leaves)
-    visited: set[str] = set()
-    queue: deque[tuple[str, int]] = deque([(node_id, 0)])
-
-    while queue:
-        current, dist = queue.popleft()
-        if current in visited:
-            continue
-        visited.add(current)
-
-        # Check if current is a leaf (no predecessors)
-        preds = list(g.predecessors(current))
-        if not preds:
-            return dist
-
-        for pred in preds:
-            if pred not in visited:
-                queue.append((pred, dist + 1))
-
-    # Node is itself a leaf or disconnected
-    return 0
+    return _levels(graph, "depth")[node_id]
 
 
 def get_height(graph: GraphModel, node_id: NodeId) -> int:
@@ -157,29 +235,54 @@ def get_height(graph: GraphModel, node_id: NodeId) -> int:
     if node_id not in graph.nodes:
         return -1
 
-    g = _build_support_graph(graph, support_only=True)
+    return _levels(graph, "height")[node_id]
 
-    # BFS from node going forward (toward roots)
-    visited: set[str] = set()
-    queue: deque[tuple[str, int]] = deque([(node_id, 0)])
-
-    while queue:
-        current, dist = queue.popleft()
-        if current in visited:
-            continue
-        visited.add(current)
 
-        # Check if current is a root (no successors)
-        succs = list(g.successors(current))
-        if not succs:
-            return dist
+def _simple_paths(
+    succ: Mapping[NodeId, Iterable[NodeId]],
+    source_id: NodeId,
+    target_id: NodeId,
+    reaching: set[NodeId],
+    max_length: int | None,
+) -> Iterator[PathList]:
+    """Yield simple paths from source to target by iterative DFS.
 
-        for succ in succs:
-            if succ not in visited:
-                queue.append((succ, dist + 1))
+    Yields in the same order as nx.all_simple_paths. Neighbors outside
+    ``reaching`` (nodes that can reach the target) are never entered, so
+    dead-end branches are pruned up front.
 
-    # Node is itself a root or disconnected
-    return 0
+    Args:
+        succ: Successors of every node.
+        source_id: Start of every path.
+        target_id: End of every path.
+        reaching: Nodes from which target_id is reachable, plus target_id.
+        max_length: Maximum path length in edges, or None for no limit.
+    """
+    if source_id == target_id:
+        yield [source_id]
+        return
+
+    path = [source_id]
+    on_path = {source_id}
+    stack = [iter(succ[source_id])]
+    while stack:
+        for child in stack[-1]:
+            if child in on_path or child not in reaching:
+                continue
+            if child == target_id:
+                # Paths end at the target; never extend through it
+                if max_length is None or len(path) <= max_length:
+                    yield [*path, child]
+                continue
+            if max_length is None or len(path) < max_length:
+                path.append(child)
+                on_path.add(child)
+                stack.append(iter(succ[child]))
+                break
+        else:
+            # All neighbors of the last node explored; backtrack
+            stack.pop()
+            on_path.discard(path.pop())
 
 
 def get_paths(
@@ -187,17 +290,22 @@ def get_paths(
     source_id: NodeId,
     target_id: NodeId,
     support_only: bool = True,
+    max_paths: int | None = None,
+    max_length: int | None = None,
 ) -> list[PathList]:
     """Get all reasoning paths from source to target.
 
     Returns all simple paths (no cycles) from source to target
-    following support relationships.
+    following support relationships. The number of paths can grow
+    exponentially with graph size; use max_paths/max_length to bound it.
 
     Args:
         graph: The argument graph.
         source_id: Starting node (typically a leaf/datum).
         target_id: Ending node (typically a root/conclusion).
         support_only: If True, only follow support links.
+        max_paths: Stop after this many paths. None for no limit.
+        max_length: Skip paths longer than this many edges. None for no limit.
 
     Returns:
         List of paths, where each path is a list of node IDs.
@@ -208,11 +316,15 @@ def get_paths(
 
     g = _build_support_graph(graph, support_only)
 
-    try:
-        return list(nx.all_simple_paths(g, source_id, target_id))
-    except nx.NetworkXError:
+    # Only nodes that can still reach the target are worth exploring
+    reaching = _reachable(g.pred, target_id)
+    reaching.add(target_id)
+    if source_id not in reaching:
         return []
 
+    paths = _simple_paths(g.succ, source_id, target_id, reaching, max_length)
+    return list(itertools.islice(paths, max_paths))
+
 
 def get_shortest_path(
     graph: GraphModel,
@@ -263,29 +375,34 @@ def get_subgraph(
     from argviz.model import GraphModel as GM
 
     # Filter nodes
-    new_nodes = [
-        node for node_id, node in graph.nodes.items()
+    new_nodes = {
+        node_id: node for node_id, node in graph.nodes.items()
         if node_id in node_ids
-    ]
+    }
 
-    # Filter links: include if all sources AND target are in node_ids
-    new_links = []
+    # Filter links: include if all sources AND target are in node_ids.
+    # Only links aimed at a selected node (or at nothing) can qualify, so
+    # they're gathered from the indexes and then put back in model order
+    new_links = {}
     if include_links:
-        for link in graph.links.values():
-            source_ids = link.get("source_ids", [])
-            target_id = link.get("target_id")
-
-            if not all(sid in node_ids for sid in source_ids):
-                continue
-            if target_id and target_id not in node_ids:
-                continue
-
-            new_links.append(link)
-
-    return GM({
-        "nodes": new_nodes,
-        "links": new_links,
-    })
+        by_target = graph.links_by_target()
+        selected = [
+            link
+            for node_id in node_ids
+            for link in by_target.get(node_id, ())
+            if all(sid in node_ids for sid in link.get("source_ids", []))
+        ]
+        selected.extend(
+            link
+            for link in graph.untargeted_links()
+            if all(sid in node_ids for sid in link.get("source_ids", []))
+        )
+        positions = graph.link_positions()
+        selected.sort(key=lambda link: positions[link["id"]])
+        new_links = {link["id"]: link for link in selected}
+
+    # Entries are already keyed by ID; skip rebuilding from lists
+    return GM._from_entries(new_nodes, new_links)
 
 
 def topological_sort(graph: GraphModel) -> list[NodeId]:
@@ -386,11 +503,15 @@ def extract_connected_component(
     if node_id not in graph.nodes:
         return GM({"nodes": [], "links": [], "edges": []})
 
-    # Build undirected version for connectivity
+    # Walk edges in both directions instead of copying to an undirected graph
     g = _build_support_graph(graph, support_only=False)
-    undirected = g.to_undirected()
-
-    # Get all nodes in the connected component
-    component = nx.node_connected_component(undirected, node_id)
+    component = {node_id}
+    stack = [node_id]
+    while stack:
+        current = stack.pop()
+        for neighbor in itertools.chain(g.succ[current], g.pred[current]):
+            if neighbor not in component:
+                component.add(neighbor)
+                stack.append(neighbor)
 
     return get_subgraph(graph, component)
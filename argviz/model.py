@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from collections import deque
+from collections.abc import Iterator
+from typing import Any, cast
 
 import networkx as nx
 
@@ -12,11 +15,44 @@ class InvalidReferenceError(ValueError):
     pass
 
 
+def _intern(value: Any) -> Any:
+    """Intern value if it is a string; return anything else unchanged."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+# IDs, types and polarities are interned: they are compared and hashed
+# constantly by the graph utilities, and interned strings match on identity
+# and are shared between models
+def _add_node(node: dict[str, Any]) -> str:
+    """Intern a node's fields in place and return its ID."""
+    node_id = node["id"] = _intern(node["id"])
+    node_type = node.get("type")
+    if isinstance(node_type, str):
+        node["type"] = sys.intern(node_type)
+    return cast(str, node_id)
+
+
+def _add_link(link: dict[str, Any]) -> str:
+    """Intern a link's fields in place and return its ID."""
+    link_id = link["id"] = _intern(link["id"])
+    polarity = link.get("polarity")
+    if isinstance(polarity, str):
+        link["polarity"] = sys.intern(polarity)
+    target_id = link.get("target_id")
+    if isinstance(target_id, str):
+        link["target_id"] = sys.intern(target_id)
+    source_ids = link.get("source_ids")
+    if isinstance(source_ids, list):
+        link["source_ids"] = [_intern(source_id) for source_id in source_ids]
+    return cast(str, link_id)
+
+
 class GraphModel:
     """Internal representation of an argument graph.
 
-    Wraps a NetworkX DiGraph with domain-specific methods for
-    traversing propositions, data, and links.
+    Keeps nodes and links keyed by ID with plain adjacency tables, and
+    domain-specific methods for traversing propositions, data, and links.
+    A NetworkX DiGraph view is available through nx_graph.
     """
 
     def __init__(self, data: dict[str, Any]) -> None:
@@ -28,34 +64,121 @@ class GraphModel:
         Raises:
             InvalidReferenceError: If a link references a non-existent node.
         """
-        self._graph = nx.DiGraph()
-        self._nodes: dict[str, dict[str, Any]] = {}
-        self._links: dict[str, dict[str, Any]] = {}
+        nodes = {_add_node(node): node for node in data.get("nodes", [])}
+        links = {_add_link(link): link for link in data.get("links", [])}
+        self._build(nodes, links)
+
+    @classmethod
+    def _from_unified(cls, entries: list[dict[str, Any]]) -> GraphModel:
+        """Build a model from the schema's single 'nodes' array.
+
+        Splits Links from content nodes in the same pass that keys them,
+        instead of sorting them into separate lists for __init__ first.
+
+        Raises:
+            InvalidReferenceError: If a link references a non-existent node.
+        """
+        nodes: dict[str, dict[str, Any]] = {}
+        links: dict[str, dict[str, Any]] = {}
+        for entry in entries:
+            if entry.get("type") == "Link":
+                links[_add_link(entry)] = entry
+            else:
+                nodes[_add_node(entry)] = entry
+        model = cls.__new__(cls)
+        model._build(nodes, links)
+        return model
+
+    @classmethod
+    def _from_entries(
+        cls,
+        nodes: dict[str, dict[str, Any]],
+        links: dict[str, dict[str, Any]],
+    ) -> GraphModel:
+        """Build a model from nodes and links already keyed by ID.
+
+        Used for subsets of an existing model: the entries are shared rather
+        than re-keyed, and were interned when that model was loaded.
+        References are still validated.
+
+        Raises:
+            InvalidReferenceError: If a link references a non-existent node.
+        """
+        model = cls.__new__(cls)
+        model._build(nodes, links)
+        return model
+
+    def _build(
+        self,
+        nodes: dict[str, dict[str, Any]],
+        links: dict[str, dict[str, Any]],
+    ) -> None:
+        """Set up model state and adjacency tables over keyed entries.
+
+        Raises:
+            InvalidReferenceError: If a link references a non-existent node.
+        """
+        # The NetworkX graph is only built if nx_graph is accessed
+        self._graph: nx.DiGraph | None = None
+        self._nodes = nodes
+        self._links = links
+
+        # Bumped by mark_changed(); derived structures cached on the model
+        # (e.g. graph_utils support graphs) are keyed by it
+        self._version = 0
+        self._support_graphs: dict[bool, tuple[tuple[int, int, int], nx.DiGraph]] = {}
+        self._levels: dict[str, tuple[tuple[int, int, int], dict[str, int]]] = {}
+        self._by_type: tuple[tuple[int, int], dict[str | None, list[str]]] | None = None
+        self._by_polarity: (
+            tuple[tuple[int, int], dict[str | None, list[dict[str, Any]]]] | None
+        ) = None
+        self._base_rates: tuple[tuple[int, int], dict[str, Any]] | None = None
+        self._text_spans: (
+            tuple[tuple[int, int, str], dict[str, list[tuple[int, int]]]] | None
+        ) = None
+        self._link_index: (
+            tuple[tuple[int, int], tuple[dict[str, list[dict[str, Any]]], ...]] | None
+        ) = None
+        self._link_order: (
+            tuple[tuple[int, int], tuple[dict[str, int], list[dict[str, Any]]]] | None
+        ) = None
+
+        # Plain adjacency tables (sources -> link -> target); dict keys keep
+        # edge insertion order and deduplicate repeated edges
+        self._succ: dict[str, dict[str, None]] = {}
+        self._pred: dict[str, dict[str, None]] = {}
 
         # Phase 1: Register all nodes (Propositions and Datums)
-        for node in data.get("nodes", []):
-            node_id = node["id"]
-            self._nodes[node_id] = node
-            self._graph.add_node(node_id, **node)
+        for node_id in nodes:
+            self._succ[node_id] = {}
+            self._pred[node_id] = {}
 
         # Phase 2: Register all links (so they can reference each other)
-        for link in data.get("links", []):
-            link_id = link["id"]
-            self._links[link_id] = link
-            self._graph.add_node(link_id, **link, _is_link=True)
+        for link_id in links:
+            self._succ.setdefault(link_id, {})
+            self._pred.setdefault(link_id, {})
+
+        # Each link's (source_ids, target_id), read from its dict once here so
+        # later edge walks use tuple unpacking instead of dict lookups
+        self._link_ends: dict[str, tuple[tuple[str, ...], str | None]] = {}
 
         # Phase 3: Validate references and build edges
         for link_id, link in self._links.items():
+            source_ids = tuple(link.get("source_ids", ()))
+            target_id = link.get("target_id")
+            self._link_ends[link_id] = (source_ids, target_id)
+
             # Validate and add edges from sources to link
-            for source_id in link.get("source_ids", []):
+            for source_id in source_ids:
                 self._validate_reference(source_id, link_id, "link source")
-                self._graph.add_edge(source_id, link_id)
+                self._succ[source_id][link_id] = None
+                self._pred[link_id][source_id] = None
 
             # Validate and add edge from link to target
-            target_id = link.get("target_id")
             if target_id:
                 self._validate_reference(target_id, link_id, "link target")
-                self._graph.add_edge(link_id, target_id)
+                self._succ[link_id][target_id] = None
+                self._pred[target_id][link_id] = None
 
     def _validate_reference(self, ref_id: str, context: str, ref_type: str) -> None:
         """Validate that a referenced node exists.
@@ -65,7 +188,8 @@ class GraphModel:
         Raises:
             InvalidReferenceError: If reference doesn't exist.
         """
-        if ref_id not in self._nodes and ref_id not in self._links:
+        # After phase 2 the adjacency table is keyed by every node and link id
+        if ref_id not in self._succ:
             raise InvalidReferenceError(
                 f"Invalid {ref_type} in {context}: '{ref_id}' does not exist"
             )
@@ -80,13 +204,135 @@ class GraphModel:
         """All link nodes (reified relationships)."""
         return self._links
 
+    def mark_changed(self) -> None:
+        """Record that nodes or links were edited in place.
+
+        Structures the graph utilities derive from the model and cache on
+        it (support graphs, levels, indexes) are rebuilt on next use. Call
+        this after any in-place edit, e.g. changing a link's polarity; until
+        then cached results may describe the graph before the edit. The
+        model's own adjacency (get_parents, get_subgraph, nx_graph) is fixed
+        when the model is built and is not affected.
+        """
+        self._version += 1
+
+    def nodes_by_type(self) -> dict[str | None, list[str]]:
+        """Index node IDs by their ``type`` field, each list in model order.
+
+        Built on first use and kept until the model changes (see
+        mark_changed). The index is shared between callers; don't modify it.
+        """
+        key = (self._version, len(self._nodes))
+        if self._by_type is None or self._by_type[0] != key:
+            index: dict[str | None, list[str]] = {}
+            for node_id, node in self._nodes.items():
+                index.setdefault(node.get("type"), []).append(node_id)
+            self._by_type = (key, index)
+        return self._by_type[1]
+
+    def links_by_polarity(self) -> dict[str | None, list[dict[str, Any]]]:
+        """Index links by their ``polarity`` field, each list in model order.
+
+        Built on first use and kept until the model changes (see
+        mark_changed). The index is shared between callers; don't modify it.
+        """
+        key = (self._version, len(self._links))
+        if self._by_polarity is None or self._by_polarity[0] != key:
+            index: dict[str | None, list[dict[str, Any]]] = {}
+            for link in self._links.values():
+                index.setdefault(link.get("polarity"), []).append(link)
+            self._by_polarity = (key, index)
+        return self._by_polarity[1]
+
+    def links_by_target(self) -> dict[str, list[dict[str, Any]]]:
+        """Index links by their ``target_id``, each list in model order.
+
+        Built on first use and kept until the model changes (see
+        mark_changed). The index is shared between callers; don't modify it.
+        """
+        return self._index_links()[0]
+
+    def links_by_source(self) -> dict[str, list[dict[str, Any]]]:
+        """Index links under each of their ``source_ids``, in model order.
+
+        A link is listed once per distinct source. Built on first use and
+        kept until the model changes (see mark_changed). The index is shared
+        between callers; don't modify it.
+        """
+        return self._index_links()[1]
+
+    def _index_links(self) -> tuple[dict[str, list[dict[str, Any]]], ...]:
+        """Build (or reuse) the by-target and by-source link indexes."""
+        key = (self._version, len(self._links))
+        if self._link_index is None or self._link_index[0] != key:
+            by_target: dict[str, list[dict[str, Any]]] = {}
+            by_source: dict[str, list[dict[str, Any]]] = {}
+            for link in self._links.values():
+                target_id = link.get("target_id")
+                if target_id:
+                    by_target.setdefault(target_id, []).append(link)
+                for source_id in dict.fromkeys(link.get("source_ids", [])):
+                    by_source.setdefault(source_id, []).append(link)
+            self._link_index = (key, (by_target, by_source))
+        return self._link_index[1]
+
+    def link_positions(self) -> dict[str, int]:
+        """Map each link ID to its position in model order.
+
+        Lets callers that gather links from an index put them back in model
+        order. Built on first use and kept until the model changes (see
+        mark_changed). The mapping is shared between callers; don't modify it.
+        """
+        return self._order_links()[0]
+
+    def untargeted_links(self) -> list[dict[str, Any]]:
+        """Links without a ``target_id``, in model order.
+
+        These are the links links_by_target leaves out. Built on first use and
+        kept until the model changes (see mark_changed). The list is shared
+        between callers; don't modify it.
+        """
+        return self._order_links()[1]
+
+    def _order_links(self) -> tuple[dict[str, int], list[dict[str, Any]]]:
+        """Build (or reuse) the link position map and untargeted link list."""
+        key = (self._version, len(self._links))
+        if self._link_order is None or self._link_order[0] != key:
+            positions = {link_id: i for i, link_id in enumerate(self._links)}
+            untargeted = [link for link in self._links.values() if not link.get("target_id")]
+            self._link_order = (key, (positions, untargeted))
+        return self._link_order[1]
+
+    def base_rates(self) -> dict[str, Any]:
+        """Map node IDs to their ``base_rate``, for nodes that have one.
+
+        Entries are in model order. Built on first use and kept until the
+        model changes (see mark_changed). The mapping is shared between
+        callers; don't modify it.
+        """
+        key = (self._version, len(self._nodes))
+        if self._base_rates is None or self._base_rates[0] != key:
+            rates = {
+                node_id: node["base_rate"]
+                for node_id, node in self._nodes.items()
+                if node.get("base_rate") is not None
+            }
+            self._base_rates = (key, rates)
+        return self._base_rates[1]
+
     def get_parents(self, node_id: str) -> list[str]:
         """Get IDs of nodes that have edges pointing to this node."""
-        return list(self._graph.predecessors(node_id))
+        try:
+            return list(self._pred[node_id])
+        except KeyError as e:
+            raise nx.NetworkXError(f"The node {node_id} is not in the digraph.") from e
 
     def get_children(self, node_id: str) -> list[str]:
         """Get IDs of nodes that this node points to."""
-        return list(self._graph.successors(node_id))
+        try:
+            return list(self._succ[node_id])
+        except KeyError as e:
+            raise nx.NetworkXError(f"The node {node_id} is not in the digraph.") from e
 
     def get_incoming_links(self, node_id: str) -> list[dict[str, Any]]:
         """Get Link nodes that target this node."""
@@ -98,13 +344,38 @@ class GraphModel:
 
     def all_node_ids(self) -> list[str]:
         """Get all node IDs (propositions, datums, and links)."""
-        return list(self._graph.nodes())
+        return list(self._succ)
 
     @property
     def nx_graph(self) -> nx.DiGraph:
-        """Access underlying NetworkX graph for advanced operations."""
+        """Access underlying NetworkX graph for advanced operations.
+
+        Built on first access, with node attributes as they are at that
+        point, and kept for the lifetime of the model.
+        """
+        if self._graph is None:
+            self._graph = self._build_nx_graph()
         return self._graph
 
+    def _build_nx_graph(self) -> nx.DiGraph:
+        """Build the NetworkX graph, adding edges in the order __init__ saw them."""
+        g = nx.DiGraph()
+        # Bulk loads: one call each instead of one per node/edge
+        g.add_nodes_from(self._nodes.items())
+        g.add_nodes_from(
+            (link_id, {**link, "_is_link": True}) for link_id, link in self._links.items()
+        )
+        g.add_edges_from(self._edges())
+        return g
+
+    def _edges(self) -> Iterator[tuple[str, str]]:
+        """Yield (source, target) edges in link order: sources -> link -> target."""
+        for link_id, (source_ids, target_id) in self._link_ends.items():
+            for source_id in source_ids:
+                yield source_id, link_id
+            if target_id:
+                yield link_id, target_id
+
     def get_subgraph(
         self,
         root_ids: str | list[str],
@@ -133,52 +404,60 @@ class GraphModel:
         if isinstance(root_ids, str):
             root_ids = [root_ids]
 
-        # Validate all roots exist
-        all_ids = set(self._nodes.keys()) | set(self._links.keys())
+        # Validate all roots exist (_succ is keyed by every node and link id)
         for root_id in root_ids:
-            if root_id not in all_ids:
+            if root_id not in self._succ:
                 raise KeyError(f"Node not found: {root_id}")
 
         # Collect nodes using BFS in both directions
-        collected: set[str] = set()
-
-        def bfs(start_ids: list[str], depth: int, get_neighbors) -> None:
-            frontier = set(start_ids)
-            for _ in range(depth + 1):
-                collected.update(frontier)
-                next_frontier: set[str] = set()
-                for node_id in frontier:
-                    next_frontier.update(get_neighbors(node_id))
-                frontier = next_frontier - collected
-
-        # Go up (toward hypotheses) - follow successors
-        bfs(root_ids, depth_up, lambda n: self._graph.successors(n))
-
-        # Go down (toward evidence) - follow predecessors
-        bfs(root_ids, depth_down, lambda n: self._graph.predecessors(n))
+        collected: set[str] = set(root_ids)
+
+        if depth_up <= 1 and depth_down <= 1:
+            # Common one-hop neighborhood: only the roots are expanded
+            for root_id in root_ids:
+                if depth_up:
+                    collected.update(self._succ[root_id])
+                if depth_down:
+                    collected.update(self._pred[root_id])
+        else:
+            def bfs(
+                start_ids: list[str], depth: int, neighbors: dict[str, dict[str, None]]
+            ) -> None:
+                # Roots are always expanded; any other node only when first
+                # collected, so the second pass doesn't re-walk the first one's
+                collected.update(start_ids)
+                queue = deque((node_id, 0) for node_id in dict.fromkeys(start_ids))
+                while queue:
+                    node_id, dist = queue.popleft()
+                    if dist == depth:
+                        continue
+                    for neighbor in neighbors[node_id]:
+                        if neighbor not in collected:
+                            collected.add(neighbor)
+                            queue.append((neighbor, dist + 1))
+
+            # Go up (toward hypotheses) - follow successors
+            bfs(root_ids, depth_up, self._succ)
+
+            # Go down (toward evidence) - follow predecessors
+            bfs(root_ids, depth_down, self._pred)
 
         # Build new data structure with only collected nodes
-        new_nodes = [
-            node for node_id, node in self._nodes.items()
+        new_nodes = {
+            node_id: node for node_id, node in self._nodes.items()
             if node_id in collected
-        ]
+        }
 
-        # Filter links: only include if all source_ids AND target_id are in collected
-        new_links = []
-        for link_id, link in self._links.items():
+        # Filter links: only include if all source_ids AND target_id are in
+        # collected (issuperset runs the source check in C)
+        new_links = {}
+        for link_id, (source_ids, target_id) in self._link_ends.items():
             if link_id not in collected:
                 continue
-            # Check all source_ids are in collected
-            source_ids = link.get("source_ids", [])
-            if not all(sid in collected for sid in source_ids):
+            if not collected.issuperset(source_ids):
                 continue
-            # Check target_id is in collected
-            target_id = link.get("target_id")
             if target_id and target_id not in collected:
                 continue
-            new_links.append(link)
+            new_links[link_id] = self._links[link_id]
 
-        return GraphModel({
-            "nodes": new_nodes,
-            "links": new_links,
-        })
+        return GraphModel._from_entries(new_nodes, new_links)
@@ -2,15 +2,44 @@
 
 from __future__ import annotations
 
+import copy
 import json
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from importlib import resources
 from pathlib import Path
-from typing import Any
+from typing import IO, Annotated, Any, cast
 
 import jsonschema
+import pydantic
 import yaml
 
 from argviz.model import GraphModel
+from argviz.types import Node
+
+try:
+    import fastjsonschema
+except ImportError:  # Optional speedup, see the "fast" extra
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Validated files remembered per parser, oldest evicted first
+_PARSE_CACHE_SIZE = 64
+
+
+def _loads_json(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 def _load_bundled_schema() -> dict[str, Any]:
@@ -18,12 +47,18 @@ def _load_bundled_schema() -> dict[str, Any]:
     try:
         # Python 3.11+ style
         schema_file = resources.files("argviz.schema").joinpath("argument_graph_schema.json")
-        return json.loads(schema_file.read_text())
+        return _loads_json(schema_file.read_bytes())
     except (FileNotFoundError, TypeError):
         # Fallback if schema not bundled (development mode)
         return {}
 
 
+@lru_cache(maxsize=1)
+def _nodes_adapter() -> pydantic.TypeAdapter[list[Node]]:
+    """Build (once) a validator for the 'nodes' array, dispatching on 'type'."""
+    return pydantic.TypeAdapter(list[Annotated[Node, pydantic.Field(discriminator="type")]])
+
+
 class SchemaValidationError(ValueError):
     """Raised when input data fails schema validation."""
     pass
@@ -36,18 +71,49 @@ class YAMLParser:
     Datum, Link) are in a single 'nodes' array, discriminated by the 'type' field.
     """
 
-    def __init__(self, schema_path: str | Path | None = None) -> None:
+    def __init__(
+        self,
+        schema_path: str | Path | None = None,
+        use_pydantic: bool = False,
+    ) -> None:
         """Initialize parser with optional custom schema.
 
         Args:
             schema_path: Path to JSON schema. Uses bundled schema if None.
+            use_pydantic: Validate the 'nodes' array against the Pydantic
+                          models in argviz.types instead of the JSON schema.
+                          Faster on large files; checks the same required
+                          fields, types and enums, but not the schema's
+                          other constraints (e.g. metadata).
         """
+        self._use_pydantic = use_pydantic
+
+        # Validated 'nodes' arrays keyed by (resolved path, mtime_ns, size)
+        self._parse_cache: OrderedDict[tuple[str, int, int], list[dict[str, Any]]] = (
+            OrderedDict()
+        )
+        self._parse_cache_lock = threading.Lock()
         if schema_path:
-            with open(schema_path) as f:
-                self._schema = json.load(f)
+            self._schema = _loads_json(Path(schema_path).read_bytes())
         else:
             self._schema = _load_bundled_schema() or self._minimal_schema()
 
+        # Check and compile the schema once, not on every parse
+        validator_cls = jsonschema.validators.validator_for(self._schema)
+        validator_cls.check_schema(self._schema)
+        self._validator = validator_cls(self._schema)
+
+        # Optional compiled validator for the common (valid) case. Defaults
+        # are not injected and formats not checked, matching jsonschema
+        self._fast_validate = None
+        if fastjsonschema is not None:
+            try:
+                self._fast_validate = fastjsonschema.compile(
+                    self._schema, use_default=False, use_formats=False
+                )
+            except fastjsonschema.JsonSchemaDefinitionException:
+                pass  # Schema uses something it can't compile; use jsonschema
+
     def _minimal_schema(self) -> dict[str, Any]:
         """Return minimal schema for essential validation.
 
@@ -85,6 +151,10 @@ class YAMLParser:
         (Proposition, Datum, Link) are in a single 'nodes' array. This method
         separates them for internal processing.
 
+        Files that haven't changed (same mtime and size) since this parser
+        last read them skip loading and validation; each call still gets
+        its own GraphModel with its own node dicts.
+
         Args:
             filepath: Path to the YAML file.
 
@@ -101,9 +171,54 @@ class YAMLParser:
         if not filepath.exists():
             raise FileNotFoundError(f"File not found: {filepath}")
 
+        st = filepath.stat()
+        key = (str(filepath.resolve()), st.st_mtime_ns, st.st_size)
+        with self._parse_cache_lock:
+            cached = self._parse_cache.get(key)
+            if cached is not None:
+                self._parse_cache.move_to_end(key)
+        if cached is not None:
+            return GraphModel._from_unified(copy.deepcopy(cached))
+
+        with open(filepath) as f:
+            nodes = self._load_nodes(f)
+
+        with self._parse_cache_lock:
+            # A copy, since the model shares (and interns into) the dicts
+            self._parse_cache[key] = copy.deepcopy(nodes)
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        # Links and content nodes share the 'nodes' array; the model splits
+        # them while keying them, in a single pass
+        return GraphModel._from_unified(nodes)
+
+    def parse_string(self, text: str) -> GraphModel:
+        """Parse YAML text and return a GraphModel.
+
+        Like parse, but for a document already in memory.
+
+        Args:
+            text: YAML document in the same format as a parse input file.
+
+        Returns:
+            GraphModel instance.
+
+        Raises:
+            ValueError: If YAML is malformed.
+            SchemaValidationError: If data fails schema validation.
+        """
+        return GraphModel._from_unified(self._load_nodes(text))
+
+    def _load_nodes(self, stream: str | IO[str]) -> list[dict[str, Any]]:
+        """Load and validate a YAML document, returning its 'nodes' array.
+
+        Raises:
+            ValueError: If YAML is malformed.
+            SchemaValidationError: If data fails schema validation.
+        """
         try:
-            with open(filepath) as f:
-                data = yaml.safe_load(f)
+            data = yaml.load(stream, Loader=_YAML_LOADER)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML: {e}") from e
 
@@ -112,27 +227,7 @@ class YAMLParser:
 
         # Validate against schema
         self._validate(data)
-
-        # Separate nodes by type: Links go to 'links', others to 'nodes'
-        all_nodes = data.get("nodes", [])
-        content_nodes = []
-        links = []
-
-        for node in all_nodes:
-            if node.get("type") == "Link":
-                links.append(node)
-            else:
-                content_nodes.append(node)
-
-        # Build normalized structure for GraphModel
-        normalized = {
-            "metadata": data.get("metadata", {}),
-            "nodes": content_nodes,
-            "links": links,
-            "edges": data.get("edges", []),
-        }
-
-        return GraphModel(normalized)
+        return cast(list[dict[str, Any]], data.get("nodes", []))
 
     def _validate(self, data: dict[str, Any]) -> None:
         """Validate data against schema.
@@ -140,11 +235,44 @@ class YAMLParser:
         Raises:
             SchemaValidationError: If validation fails.
         """
-        try:
-            jsonschema.validate(data, self._schema)
-        except jsonschema.ValidationError as e:
+        if self._use_pydantic:
+            self._validate_pydantic(data)
+            return
+
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(data)
+                return
+            except fastjsonschema.JsonSchemaValueException:
+                pass  # Re-check below for jsonschema's detailed error
+
+        # Same error selection as jsonschema.validate
+        e = jsonschema.exceptions.best_match(self._validator.iter_errors(data))
+        if e is not None:
             # Extract the most relevant part of the error message
             field = ".".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
             raise SchemaValidationError(
                 f"Schema validation failed at '{field}': {e.message}"
             ) from e
+
+    def _validate_pydantic(self, data: dict[str, Any]) -> None:
+        """Validate the 'nodes' array with the Pydantic node models.
+
+        The parsed dicts are kept as they are; the models only check them,
+        so defaults are not filled in (as with the JSON schema).
+
+        Raises:
+            SchemaValidationError: If validation fails.
+        """
+        if not isinstance(data, dict) or "nodes" not in data:
+            raise SchemaValidationError(
+                "Schema validation failed at 'root': 'nodes' is a required property"
+            )
+        try:
+            _nodes_adapter().validate_python(data["nodes"])
+        except pydantic.ValidationError as e:
+            error = e.errors()[0]
+            field = ".".join(["nodes", *(str(p) for p in error["loc"])])
+            raise SchemaValidationError(
+                f"Schema validation failed at '{field}': {error['msg']}"
+            ) from e
@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NodeStyle:
     """Visual properties for a node."""
     shape: str
@@ -22,7 +23,7 @@ class NodeStyle:
     fixed_size: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EdgeStyle:
     """Visual properties for an edge."""
     line_color: str
@@ -48,12 +49,44 @@ COLORS = {
     "edge_default": "#333333",
 }
 
+# Map theme keys to COLORS keys
+_THEME_TO_DEFAULT = {
+    "proposition": "proposition_fill",
+    "proposition_implicit": "proposition_implicit_fill",
+    "conclusion": "conclusion_fill",
+    "datum": "datum_fill",
+    "link_supports": "link_supports_fill",
+    "link_undermines": "link_undermines_fill",
+    "proposition_border": "proposition_border",
+    "proposition_implicit_border": "proposition_implicit_border",
+    "conclusion_border": "conclusion_border",
+    "datum_border": "datum_border",
+    "link_supports_border": "link_supports_border",
+    "link_undermines_border": "link_undermines_border",
+    "edge_supports": "link_supports_border",
+    "edge_undermines": "link_undermines_border",
+    "edge_default": "edge_default",
+    "background": "background",
+}
+
 # Default max characters before truncation
 DEFAULT_MAX_LABEL_CHARS = 100
 
 # Pattern for valid hex colors (#RGB or #RRGGBB)
 _HEX_COLOR_PATTERN = re.compile(r'^#([0-9A-Fa-f]{3}|[0-9A-Fa-f]{6})$')
 
+_HEXDIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+@lru_cache(maxsize=256)
+def _is_hex_color(value: str) -> bool:
+    """Check one color value; cached, as themes reuse a few distinct colors."""
+    # Plain character checks settle the usual #RGB/#RRGGBB values;
+    # the regex only sees values that fail them
+    if len(value) in (4, 7) and value[0] == "#" and _HEXDIGITS.issuperset(value[1:]):
+        return True
+    return _HEX_COLOR_PATTERN.match(value) is not None
+
 
 def _validate_colors(colors: dict[str, str]) -> None:
     """Validate that all color values are valid hex colors.
@@ -65,7 +98,7 @@ def _validate_colors(colors: dict[str, str]) -> None:
         ValueError: If any color value is invalid.
     """
     for key, value in colors.items():
-        if not _HEX_COLOR_PATTERN.match(value):
+        if not _is_hex_color(value):
             raise ValueError(
                 f"Invalid color '{value}' for key '{key}'. "
                 "Expected hex format (#RGB or #RRGGBB)."
@@ -101,16 +134,19 @@ def _load_theme(theme_path: str | None) -> dict[str, str]:
         content = path.read_text()
 
     import yaml
-    data = yaml.safe_load(content)
+    # Prefer the libyaml-backed loader when PyYAML was built with it
+    data = yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
     colors = data.get("colors", {})
     _validate_colors(colors)
     return colors
 
 
+@lru_cache(maxsize=4096)
 def truncate_label(text: str, max_chars: int = DEFAULT_MAX_LABEL_CHARS) -> tuple[str, bool]:
     """Truncate text with ellipsis if it exceeds max_chars.
 
-    Attempts to truncate at word boundaries when possible.
+    Attempts to truncate at word boundaries when possible. Cached, since
+    the same labels come back on every re-render and for duplicate nodes.
 
     Args:
         text: The text to potentially truncate.
@@ -150,6 +186,63 @@ class StyleRegistry:
         """
         self._colors = _load_theme(theme)
         self.max_label_chars = max_label_chars
+        # Every known key resolved through theme -> COLORS -> fallback up front
+        self._resolved_colors = {key: self._resolve_color(key) for key in _THEME_TO_DEFAULT}
+        self._build_styles()
+
+    def _build_styles(self) -> None:
+        """Build the fixed set of styles once, so lookups return shared instances."""
+        self._node_styles = {
+            "Datum": NodeStyle(
+                shape="ellipse",
+                fill_color=self._get_color("datum"),
+                border_color=self._get_color("datum_border"),
+            ),
+            # Conclusion: same shape as Proposition, but gold to indicate terminal claim
+            "Conclusion": NodeStyle(
+                shape="box",
+                fill_color=self._get_color("conclusion"),
+                border_color=self._get_color("conclusion_border"),
+            ),
+            "implicit": NodeStyle(
+                shape="box",
+                fill_color=self._get_color("proposition_implicit"),
+                border_color=self._get_color("proposition_implicit_border"),
+            ),
+            "Proposition": NodeStyle(
+                shape="box",
+                fill_color=self._get_color("proposition"),
+                border_color=self._get_color("proposition_border"),
+            ),
+        }
+        self._link_styles = {
+            "undermines": NodeStyle(
+                shape="diamond",
+                fill_color=self._get_color("link_undermines"),
+                border_color=self._get_color("link_undermines_border"),
+                width=0.3,
+                height=0.3,
+                fixed_size=True,
+            ),
+            "supports": NodeStyle(
+                shape="diamond",
+                fill_color=self._get_color("link_supports"),
+                border_color=self._get_color("link_supports_border"),
+                width=0.3,
+                height=0.3,
+                fixed_size=True,
+            ),
+        }
+        self._edge_styles = {
+            "undermines": EdgeStyle(
+                line_color=self._get_color("edge_undermines"),
+                line_style="dashed",
+            ),
+            "supports": EdgeStyle(
+                line_color=self._get_color("edge_supports"),
+                line_style="solid",
+            ),
+        }
 
     def _get_color(self, key: str) -> str:
         """Get color from theme, falling back to COLORS default.
@@ -160,27 +253,15 @@ class StyleRegistry:
         Returns:
             Hex color string.
         """
-        # Map theme keys to COLORS keys
-        theme_to_default = {
-            "proposition": "proposition_fill",
-            "proposition_implicit": "proposition_implicit_fill",
-            "conclusion": "conclusion_fill",
-            "datum": "datum_fill",
-            "link_supports": "link_supports_fill",
-            "link_undermines": "link_undermines_fill",
-            "proposition_border": "proposition_border",
-            "proposition_implicit_border": "proposition_implicit_border",
-            "conclusion_border": "conclusion_border",
-            "datum_border": "datum_border",
-            "link_supports_border": "link_supports_border",
-            "link_undermines_border": "link_undermines_border",
-            "edge_supports": "link_supports_border",
-            "edge_undermines": "link_undermines_border",
-            "edge_default": "edge_default",
-            "background": "background",
-        }
+        color = self._resolved_colors.get(key)
+        if color is None:
+            color = self._resolve_color(key)
+        return color
+
+    def _resolve_color(self, key: str) -> str:
+        """Look up a color key in the theme, then COLORS, then the fallback."""
         # Default background to white if not in theme or COLORS
-        default_key = theme_to_default.get(key, key)
+        default_key = _THEME_TO_DEFAULT.get(key, key)
         fallback = "#FFFFFF" if key == "background" else "#000000"
         return self._colors.get(key, COLORS.get(default_key, fallback))
 
@@ -189,6 +270,9 @@ class StyleRegistry:
     ) -> NodeStyle:
         """Get visual style for a node.
 
+        Styles are built once per registry and shared between calls (they
+        are frozen, so callers can't change them for one another).
+
         Args:
             node: Node data dictionary.
             is_link: Whether this is a Link node (reified relationship).
@@ -201,79 +285,34 @@ class StyleRegistry:
 
         node_type = node.get("type", "Proposition")
 
-        if node_type == "Datum":
-            return NodeStyle(
-                shape="ellipse",
-                fill_color=self._get_color("datum"),
-                border_color=self._get_color("datum_border"),
-            )
-        elif node_type == "Conclusion":
-            # Conclusion: same shape as Proposition, but gold to indicate terminal claim
-            return NodeStyle(
-                shape="box",
-                fill_color=self._get_color("conclusion"),
-                border_color=self._get_color("conclusion_border"),
-            )
-        else:  # Proposition or unknown
-            # Check if this is an implicit/inferred proposition
-            # "implicit" = assumed co-premise from stems
-            # "inferred" = synthesized auxiliary from MSA iteration
-            # Both represent claims not explicitly stated in source text
-            explicitness = node.get("explicitness")
-            if explicitness in ("implicit", "inferred"):
-                return NodeStyle(
-                    shape="box",
-                    fill_color=self._get_color("proposition_implicit"),
-                    border_color=self._get_color("proposition_implicit_border"),
-                )
-            return NodeStyle(
-                shape="box",
-                fill_color=self._get_color("proposition"),
-                border_color=self._get_color("proposition_border"),
-            )
+        if node_type == "Datum" or node_type == "Conclusion":
+            return self._node_styles[node_type]
+        # Proposition or unknown
+        # Check if this is an implicit/inferred proposition
+        # "implicit" = assumed co-premise from stems
+        # "inferred" = synthesized auxiliary from MSA iteration
+        # Both represent claims not explicitly stated in source text
+        if node.get("explicitness") in ("implicit", "inferred"):
+            return self._node_styles["implicit"]
+        return self._node_styles["Proposition"]
 
     def _get_link_style(self, link: dict[str, Any]) -> NodeStyle:
         """Get style for a Link node."""
-        polarity = link.get("polarity", "supports")
-
-        if polarity == "undermines":
-            return NodeStyle(
-                shape="diamond",
-                fill_color=self._get_color("link_undermines"),
-                border_color=self._get_color("link_undermines_border"),
-                width=0.3,
-                height=0.3,
-                fixed_size=True,
-            )
-        else:  # supports
-            return NodeStyle(
-                shape="diamond",
-                fill_color=self._get_color("link_supports"),
-                border_color=self._get_color("link_supports_border"),
-                width=0.3,
-                height=0.3,
-                fixed_size=True,
-            )
+        if link.get("polarity", "supports") == "undermines":
+            return self._link_styles["undermines"]
+        return self._link_styles["supports"]
 
     def get_link_edge_style(self, link: dict[str, Any]) -> EdgeStyle:
         """Get visual style for edges connecting through a Link node.
 
+        Like get_node_style, the returned instance is shared.
+
         Args:
             link: Link data dictionary with 'polarity' field.
 
         Returns:
             EdgeStyle with visual properties.
         """
-        polarity = link.get("polarity", "supports")
-
-        if polarity == "undermines":
-            return EdgeStyle(
-                line_color=self._get_color("edge_undermines"),
-                line_style="dashed",
-            )
-        else:  # supports
-            return EdgeStyle(
-                line_color=self._get_color("edge_supports"),
-                line_style="solid",
-            )
-
+        if link.get("polarity", "supports") == "undermines":
+            return self._edge_styles["undermines"]
+        return self._edge_styles["supports"]
@@ -0,0 +1,21 @@
+"""Shared pytest configuration for argviz tests."""
+
+import gc
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _disable_gc():
+    """Turn off cyclic GC while each test runs, collecting once after it.
+
+    Parsing and validation allocate many short-lived objects, which would
+    otherwise trigger repeated young-generation collections mid-test.
+    Collecting between tests keeps cycles from piling up across the run.
+    """
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.collect()
+        gc.enable()
@@ -1,9 +1,27 @@
 """Basic smoke tests for argviz."""
 
+import base64
+import collections
+import datetime
+import gzip
+import hashlib
+import inspect
+import json
+import networkx as nx
+import pickle
+import pydantic
 import pytest
+import re
+import shutil
+import sys
+from functools import cache
 from pathlib import Path
 
-from argviz import load, visualize
+from argviz import load, visualize, visualize_many
+from argviz.exporters.cytoscape import CytoscapeExporter
+from argviz.exporters.dot import DOTExporter
+from argviz.exporters.outline import OutlineExporter, OutlineParseError, OutlineParser
+from argviz.exporters.svg import SVGExporter
 from argviz.graph_utils import (
     get_leaves,
     get_roots,
@@ -11,23 +29,95 @@ from argviz.graph_utils import (
     filter_by_type,
     compute_graph_stats,
     check_acyclic,
+    compute_all_depths,
+    compute_all_heights,
+    get_depth,
+    get_height,
+    find_cycles,
+    find_all_cycles,
+    get_paths,
+    filter_nodes,
+    filter_nodes_with_textual_basis,
+    get_all_nodes,
+    get_all_links,
+    get_subgraph,
 )
+from argviz.model import GraphModel
+from argviz.parser import SchemaValidationError, YAMLParser
+from argviz.types import Link, Proposition
 
 
 EXAMPLE_PATH = Path(__file__).parent.parent / "examples" / "argument_graph.yaml"
 
+# Checked once at import instead of running `which` for every skipif
+_HAS_DOT = shutil.which("dot") is not None
+
+# Case-insensitive markers, searched without lowercasing a copy of the output
+_HTML_RE = re.compile("<html>", re.IGNORECASE)
+_CYTOSCAPE_RE = re.compile("cytoscape", re.IGNORECASE)
+_SVG_RE = re.compile("<svg", re.IGNORECASE)
+
+
+@pytest.fixture(scope="session")
+def example_model(pytestconfig):
+    """The example graph, parsed once; tests must not modify it.
+
+    Pickled into pytest's cache between runs, keyed by the example file and
+    the sources that decide how it loads, so only a change to those re-parses.
+    """
+    cache_store = getattr(pytestconfig, "cache", None)
+    if cache_store is None:
+        # pytest run with -p no:cacheprovider
+        return load(EXAMPLE_PATH)
+
+    digest = hashlib.sha1()
+    for path in (EXAMPLE_PATH, inspect.getfile(GraphModel), inspect.getfile(YAMLParser)):
+        digest.update(Path(path).read_bytes())
+    key = f"argviz/example_model/{digest.hexdigest()}"
+
+    cached = cache_store.get(key, None)
+    if cached is not None:
+        return pickle.loads(base64.b64decode(cached))
+    model = load(EXAMPLE_PATH)
+    cache_store.set(key, base64.b64encode(pickle.dumps(model)).decode())
+    return model
+
+
+@pytest.fixture
+def parse_yaml():
+    """Parse a YAML document from a string, without going through a file."""
+    return YAMLParser().parse_string
+
+
+@pytest.fixture(scope="session")
+def example_output():
+    """Render the example graph to a format, once per format."""
+    return cache(lambda format: visualize(EXAMPLE_PATH, format=format))
+
 
 class TestLoad:
     """Test loading argument graphs."""
 
     def test_load_example(self):
+        # Not the example_model fixture, which may come from pytest's cache
         model = load(EXAMPLE_PATH)
         assert len(model.nodes) > 0
         assert len(model.links) > 0
 
-    def test_nodes_have_required_fields(self):
-        model = load(EXAMPLE_PATH)
-        for node_id, node in model.nodes.items():
+    def test_reparse_returns_fresh_model(self, tmp_path):
+        path = tmp_path / "graph.yaml"
+        path.write_text('nodes:\n  - type: Proposition\n    id: P1\n    content: "A"\n')
+        parser = YAMLParser()
+        first = parser.parse(path)
+        first.nodes["P1"]["content"] = "changed"
+        assert parser.parse(path).nodes["P1"]["content"] == "A"
+
+        # A rewritten file is parsed again
+        path.write_text('nodes:\n  - type: Proposition\n    id: P2\n    content: "BB"\n')
+        assert list(parser.parse(path).nodes) == ["P2"]
+
+    def test_nodes_have_required_fields(self, example_model):
+        for node_id, node in example_model.nodes.items():
             assert "id" in node
             assert "type" in node
             assert "content" in node
@@ -36,93 +126,285 @@ class TestLoad:
 class TestExport:
     """Test export formats."""
 
-    def test_export_dot(self):
-        output = visualize(EXAMPLE_PATH, format="dot")
+    def test_export_dot(self, example_output):
+        output = example_output("dot")
         assert "digraph" in output
         assert len(output) > 100
 
-    def test_export_cytoscape_json(self):
-        output = visualize(EXAMPLE_PATH, format="cytoscape-json")
+    def test_export_cytoscape_json(self, example_output):
+        output = example_output("cytoscape-json")
         assert "elements" in output
         assert "nodes" in output
 
-    def test_export_cytoscape_html(self):
-        output = visualize(EXAMPLE_PATH, format="cytoscape-html")
-        assert "<html>" in output.lower()
-        assert "cytoscape" in output.lower()
-
-    @pytest.mark.skipif(
-        not pytest.importorskip("subprocess").run(
-            ["which", "dot"], capture_output=True
-        ).returncode == 0,
-        reason="Graphviz not installed",
-    )
-    def test_export_svg(self):
-        output = visualize(EXAMPLE_PATH, format="svg")
-        assert "<svg" in output.lower()
+    def test_export_cytoscape_html(self, example_output):
+        output = example_output("cytoscape-html")
+        assert _HTML_RE.search(output)
+        assert _CYTOSCAPE_RE.search(output)
+
+    def test_visualize_many_matches_visualize(self, tmp_path, example_output):
+        outputs = {
+            "dot": tmp_path / "graph.dot",
+            "cytoscape-json": tmp_path / "graph.json",
+        }
+        results = visualize_many(EXAMPLE_PATH, outputs)
+        for format, path in outputs.items():
+            expected = example_output(format)
+            assert results[format] == expected
+            assert path.read_text() == expected
+
+    def test_visualize_many_writes_files(self, tmp_path):
+        outputs = {
+            format: tmp_path / f"graph.{format}"
+            for format in ("dot", "cytoscape-json", "cytoscape-html")
+        }
+        results = visualize_many(EXAMPLE_PATH, outputs)
+        assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+            path.name for path in outputs.values()
+        )
+        for format, path in outputs.items():
+            assert path.read_bytes() == results[format].encode("utf-8")
+
+        # Formats are checked before anything is written
+        with pytest.raises(ValueError, match="Unsupported format"):
+            visualize_many(EXAMPLE_PATH, {"dot": tmp_path / "new.dot", "png": tmp_path / "g.png"})
+        assert not (tmp_path / "new.dot").exists()
+
+    @pytest.mark.skipif(not _HAS_DOT, reason="Graphviz not installed")
+    def test_export_svg(self, example_output):
+        output = example_output("svg")
+        assert _SVG_RE.search(output)
+
+    @pytest.mark.skipif(not _HAS_DOT, reason="Graphviz not installed")
+    def test_export_svg_many_matches_export(self, example_model):
+        exporter = SVGExporter()
+        expected = exporter.export(example_model)
+        assert exporter.export_many([example_model, example_model]) == [expected] * 2
+
+    @pytest.mark.skipif(not _HAS_DOT, reason="Graphviz not installed")
+    def test_export_svg_many_parallel_matches_export(self, example_model):
+        exporter = SVGExporter()
+        small_model = GraphModel({"nodes": [{"id": "P1", "type": "Proposition"}], "links": []})
+        models = [example_model, small_model, example_model]
+        expected = [exporter.export(model) for model in models]
+        assert exporter.export_many_parallel(models, max_workers=2) == expected
+        assert exporter.export_many_parallel(models[:1]) == expected[:1]
+
+    @pytest.mark.skipif(not _HAS_DOT, reason="Graphviz not installed")
+    def test_export_svgz_to_file(self, tmp_path, example_model):
+        exporter = SVGExporter()
+        path = tmp_path / "graph.svgz"
+        exporter.export_to_file(example_model, str(path))
+        data = path.read_bytes()
+        assert data[:2] == b"\x1f\x8b"
+        assert gzip.decompress(data).decode() == exporter.export(example_model)
+
+
+# Support links for TestGraphUtils.test_get_paths_matches_networkx: four D1 -> C1 paths
+PATH_EDGES = [("D1", "P1"), ("D1", "P2"), ("P1", "C1"), ("P2", "C1"), ("D1", "C1"), ("P1", "P2")]
 
 
 class TestGraphUtils:
     """Test graph utility functions."""
 
-    def test_get_leaves(self):
-        model = load(EXAMPLE_PATH)
-        leaves = get_leaves(model)
+    def test_get_leaves(self, example_model):
+        leaves = get_leaves(example_model)
         assert len(leaves) > 0
 
-    def test_get_roots(self):
-        model = load(EXAMPLE_PATH)
-        roots = get_roots(model)
+    def test_get_roots(self, example_model):
+        roots = get_roots(example_model)
         assert len(roots) > 0
 
-    def test_get_ancestors(self):
-        model = load(EXAMPLE_PATH)
+    def test_get_ancestors(self, example_model):
         # Get a non-leaf node to find ancestors for
-        roots = get_roots(model)
+        roots = get_roots(example_model)
         if roots:
-            ancestors = get_ancestors(model, roots[0])
+            ancestors = get_ancestors(example_model, roots[0])
             # Ancestors may be empty for root, that's ok
             assert isinstance(ancestors, (list, set))
 
-    def test_filter_by_type(self):
-        model = load(EXAMPLE_PATH)
-        datums = filter_by_type(model, "Datum")
+    def test_filter_by_type(self, example_model):
+        datums = filter_by_type(example_model, "Datum")
         assert len(datums) > 0
-        conclusions = filter_by_type(model, "Conclusion")
+        conclusions = filter_by_type(example_model, "Conclusion")
         assert len(conclusions) > 0
 
-    def test_compute_graph_stats(self):
-        model = load(EXAMPLE_PATH)
-        stats = compute_graph_stats(model)
+    def test_filter_by_type_several(self, example_model):
+        expected = [
+            node_id for node_id, node in example_model.nodes.items()
+            if node["type"] in ("Datum", "Conclusion")
+        ]
+        assert filter_by_type(example_model, ["Datum", "Conclusion"]) == expected
+        # Entries that aren't type names just match nothing
+        assert filter_by_type(example_model, ["Datum", None, "Conclusion"]) == expected
+
+    def test_compute_graph_stats(self, example_model):
+        stats = compute_graph_stats(example_model)
         assert isinstance(stats, dict)
 
-    def test_check_acyclic(self):
-        model = load(EXAMPLE_PATH)
-        is_acyclic = check_acyclic(model)
+    def test_check_acyclic(self, example_model):
+        is_acyclic = check_acyclic(example_model)
         assert is_acyclic is True
 
+    def test_compute_all_depths_matches_get_depth(self, example_model):
+        depths = compute_all_depths(example_model)
+        heights = compute_all_heights(example_model)
+        for node_id in example_model.nodes:
+            assert depths[node_id] == get_depth(example_model, node_id)
+            assert heights[node_id] == get_height(example_model, node_id)
+
+    def test_mark_changed_refreshes_cached_results(self):
+        model = GraphModel({
+            "nodes": [{"id": "P1", "type": "Proposition"}, {"id": "P2", "type": "Proposition"}],
+            "links": [{"id": "L1", "source_ids": ["P1"], "target_id": "P2",
+                       "polarity": "supports"}],
+        })
+        assert get_ancestors(model, "P2") == ["P1"]
+        assert get_leaves(model) == ["P1"]
+
+        model.links["L1"]["polarity"] = "undermines"
+        model.mark_changed()
+        assert get_ancestors(model, "P2") == []
+        assert get_leaves(model) == ["P1", "P2"]
+
+    def test_find_cycles_one_per_component(self, example_model):
+        # P1 <-> P2 and P2 <-> P3: one strongly connected component, two cycles
+        model = GraphModel({
+            "nodes": [{"id": f"P{i}", "type": "Proposition"} for i in (1, 2, 3)],
+            "links": [
+                {"id": "L1", "source_ids": ["P1"], "target_id": "P2", "polarity": "supports"},
+                {"id": "L2", "source_ids": ["P2"], "target_id": "P1", "polarity": "supports"},
+                {"id": "L3", "source_ids": ["P2"], "target_id": "P3", "polarity": "supports"},
+                {"id": "L4", "source_ids": ["P3"], "target_id": "P2", "polarity": "supports"},
+            ],
+        })
+        assert len(find_cycles(model)) == 1
+        assert len(find_all_cycles(model)) == 2
+        assert find_cycles(example_model) == []
+
+    def test_get_paths_matches_networkx(self):
+        model = GraphModel({
+            "nodes": [{"id": node_id, "type": "Proposition"}
+                      for node_id in ("C1", "P1", "P2", "D1", "X1")],
+            "links": [
+                {"id": f"L{i}", "source_ids": [source], "target_id": target,
+                 "polarity": "supports"}
+                for i, (source, target) in enumerate(PATH_EDGES)
+            ] + [{"id": "LX", "source_ids": ["X1"], "target_id": "P1",
+                  "polarity": "undermines"}],
+        })
+        expected = list(nx.all_simple_paths(nx.DiGraph(PATH_EDGES), "D1", "C1"))
+        assert len(expected) == 4
+        # Same paths in the same order
+        assert get_paths(model, "D1", "C1") == expected
+
+        assert get_paths(model, "D1", "C1", max_paths=2) == expected[:2]
+        assert get_paths(model, "D1", "C1", max_length=2) == [
+            path for path in expected if len(path) <= 3
+        ]
+        assert get_paths(model, "C1", "C1") == [["C1"]]
+        assert get_paths(model, "C1", "D1") == []
+
+        # Undermining links are followed only when support_only is False
+        assert get_paths(model, "X1", "C1") == []
+        assert len(get_paths(model, "X1", "C1", support_only=False)) == 2
+
+    def test_filter_nodes_with_textual_basis(self, example_model):
+        with_basis = filter_nodes_with_textual_basis(example_model)
+        without_basis = filter_nodes_with_textual_basis(example_model, has_basis=False)
+        assert with_basis
+        assert without_basis
+        assert with_basis == filter_nodes(
+            example_model, lambda n: n.get("textual_basis") is not None
+        )
+        assert without_basis == filter_nodes(
+            example_model, lambda n: n.get("textual_basis") is None
+        )
+
+    def test_get_all_as_view(self):
+        model = GraphModel({
+            "nodes": [{"id": "P1", "type": "Proposition"}, {"id": "P2", "type": "Proposition"}],
+            "links": [{"id": "L1", "source_ids": ["P1"], "target_id": "P2",
+                       "polarity": "supports"}],
+        })
+        nodes = get_all_nodes(model, as_list=False)
+        links = get_all_links(model, as_list=False)
+        assert list(nodes) == get_all_nodes(model)
+        assert list(links) == get_all_links(model)
+
+        # A live view, unlike the default list copy
+        node_list = get_all_nodes(model)
+        model.nodes["P3"] = {"id": "P3", "type": "Proposition"}
+        assert len(nodes) == 3
+        assert len(node_list) == 2
+
+
+class TestSerialize:
+    """Test JSON serialization of graphs."""
+
+    def test_graph_to_bytes_same_without_orjson(self, monkeypatch):
+        from argviz.graph_utils import serialize
+
+        model = GraphModel({
+            "nodes": [{"id": "P1", "type": "Proposition", "content": "Ünïcode",
+                       "base_rate": float("nan"), "date": datetime.date(2024, 1, 2)}],
+            "links": [],
+        })
+        outputs = [serialize.graph_to_bytes(model)]
+        monkeypatch.setattr(serialize, "orjson", None)
+        outputs.append(serialize.graph_to_bytes(model))
+
+        assert outputs[0] == outputs[1]
+        node = json.loads(outputs[1])["nodes"][0]
+        assert node["base_rate"] is None
+        assert node["date"] == "2024-01-02"
+        assert node["content"] == "Ünïcode"
+
+    @pytest.mark.parametrize("format", ["json", "html"])
+    def test_cytoscape_same_without_orjson(self, monkeypatch, format):
+        from argviz.exporters import cytoscape
+
+        model = GraphModel({
+            "nodes": [{"id": "P1", "type": "Proposition", "content": "Café … naïve"}],
+            "links": [],
+        })
+        outputs = [cytoscape.CytoscapeExporter().export(model, format=format)]
+        monkeypatch.setattr(cytoscape, "orjson", None)
+        outputs.append(cytoscape.CytoscapeExporter().export(model, format=format))
+
+        assert outputs[0] == outputs[1]
+        assert "Café … naïve" in outputs[1]
+
 
 class TestSubgraph:
     """Test subgraph extraction."""
 
-    def test_get_subgraph(self):
-        model = load(EXAMPLE_PATH)
+    def test_get_subgraph(self, example_model):
         # Get subgraph around the conclusion
-        subgraph = model.get_subgraph("C1", depth_up=2, depth_down=0)
+        subgraph = example_model.get_subgraph("C1", depth_up=2, depth_down=0)
         assert len(subgraph.nodes) >= 1
 
+    def test_graph_utils_subgraph_keeps_model_order(self, example_model):
+        # Selecting through the link indexes must match a plain pass over the links
+        node_ids = set(list(example_model.nodes)[::2]) | set(get_ancestors(example_model, "C1"))
+        expected = [
+            link_id for link_id, link in example_model.links.items()
+            if link["target_id"] in node_ids
+            and all(source_id in node_ids for source_id in link["source_ids"])
+        ]
+        assert expected
+        assert list(get_subgraph(example_model, node_ids).links) == expected
+        assert list(get_subgraph(example_model, node_ids, include_links=False).links) == []
+
 
 class TestStrengthField:
     """Test the strength field on Links (renamed from reliability)."""
 
-    def test_links_have_strength_field(self):
-        model = load(EXAMPLE_PATH)
-        for link_id, link in model.links.items():
+    def test_links_have_strength_field(self, example_model):
+        for link_id, link in example_model.links.items():
             assert "strength" in link, f"Link {link_id} missing strength field"
             assert 0 <= link["strength"] <= 1
 
     def test_strength_in_pydantic_model(self):
-        from argviz.types import Link
         link = Link(
             id="test",
             source_ids=["A"],
@@ -133,7 +415,6 @@ class TestStrengthField:
         assert link.strength == 0.7
 
     def test_strength_default_value(self):
-        from argviz.types import Link
         link = Link(
             id="test",
             source_ids=["A"],
@@ -146,16 +427,14 @@ class TestStrengthField:
 class TestAuxiliaryField:
     """Test the auxiliary field on Propositions."""
 
-    def test_auxiliary_nodes_exist(self):
-        model = load(EXAMPLE_PATH)
+    def test_auxiliary_nodes_exist(self, example_model):
         auxiliary_nodes = [
-            node_id for node_id, node in model.nodes.items()
+            node_id for node_id, node in example_model.nodes.items()
             if node.get("auxiliary", False)
         ]
         assert len(auxiliary_nodes) > 0, "Example should have auxiliary nodes"
 
     def test_auxiliary_in_pydantic_model(self):
-        from argviz.types import Proposition
         prop = Proposition(
             id="test",
             content="Test proposition",
@@ -164,17 +443,15 @@ class TestAuxiliaryField:
         assert prop.auxiliary is True
 
     def test_auxiliary_default_false(self):
-        from argviz.types import Proposition
         prop = Proposition(
             id="test",
             content="Test proposition",
         )
         assert prop.auxiliary is False
 
-    def test_auxiliary_edges_dashed_in_dot(self):
+    def test_auxiliary_edges_dashed_in_dot(self, example_output):
         """Auxiliary nodes should have dashed edges in DOT output."""
-        model = load(EXAMPLE_PATH)
-        dot_output = visualize(EXAMPLE_PATH, format="dot")
+        dot_output = example_output("dot")
         # DOT format uses style=dashed for auxiliary edges
         assert "dashed" in dot_output, "DOT output should have dashed edges for auxiliary nodes"
 
@@ -182,27 +459,17 @@ class TestAuxiliaryField:
 class TestSchemaValidation:
     """Test that invalid input is rejected."""
 
-    def test_missing_required_field_raises(self):
-        from argviz.parser import YAMLParser
-        import tempfile
-
+    def test_missing_required_field_raises(self, parse_yaml):
         # Missing 'content' field on Proposition
         invalid_yaml = """
 nodes:
   - type: Proposition
     id: P1
 """
-        parser = YAMLParser()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            f.flush()
-            with pytest.raises(Exception):  # Schema validation error
-                parser.parse(f.name)
-
-    def test_missing_source_on_datum_raises(self):
-        from argviz.parser import YAMLParser
-        import tempfile
+        with pytest.raises(SchemaValidationError):
+            parse_yaml(invalid_yaml)
 
+    def test_missing_source_on_datum_raises(self, parse_yaml):
         # Datum requires 'source' field
         invalid_yaml = """
 nodes:
@@ -210,16 +477,38 @@ nodes:
     id: D1
     content: "Some finding"
 """
-        parser = YAMLParser()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            f.flush()
-            with pytest.raises(Exception):
-                parser.parse(f.name)
+        with pytest.raises(SchemaValidationError):
+            parse_yaml(invalid_yaml)
+
+    def test_fast_validation_matches_jsonschema(self, example_model):
+        pytest.importorskip("fastjsonschema")
+        fast = YAMLParser()
+        assert fast._fast_validate is not None
+        slow = YAMLParser()
+        slow._fast_validate = None
+        assert len(fast.parse(EXAMPLE_PATH).nodes) == len(example_model.nodes)
+
+        # Datum requires 'source' field; both paths report jsonschema's error
+        invalid_yaml = 'nodes:\n  - type: Datum\n    id: D1\n    content: "Some finding"\n'
+        messages = []
+        for parser in (fast, slow):
+            with pytest.raises(SchemaValidationError) as excinfo:
+                parser.parse_string(invalid_yaml)
+            messages.append(str(excinfo.value))
+        assert messages[0] == messages[1]
+
+    def test_pydantic_validation(self, tmp_path, example_model):
+        parser = YAMLParser(use_pydantic=True)
+        assert len(parser.parse(EXAMPLE_PATH).nodes) == len(example_model.nodes)
+
+        # Datum requires 'source' field
+        path = tmp_path / "invalid.yaml"
+        path.write_text('nodes:\n  - type: Datum\n    id: D1\n    content: "Some finding"\n')
+        with pytest.raises(SchemaValidationError, match="nodes.0.Datum.source"):
+            parser.parse(path)
 
     def test_invalid_polarity_raises(self):
-        from argviz.types import Link
-        with pytest.raises(Exception):
+        with pytest.raises(pydantic.ValidationError):
             Link(
                 id="test",
                 source_ids=["A"],
@@ -232,54 +521,29 @@ class TestErrorHandling:
     """Test error handling for common issues."""
 
     def test_file_not_found(self):
-        with pytest.raises(Exception):
+        with pytest.raises(FileNotFoundError):
             load("nonexistent_file.yaml")
 
-    def test_invalid_yaml_syntax(self):
-        from argviz.parser import YAMLParser
-        import tempfile
-
+    def test_invalid_yaml_syntax(self, parse_yaml):
         invalid_yaml = """
 nodes:
   - type: Proposition
     id: P1
     content: "unclosed quote
 """
-        parser = YAMLParser()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            f.flush()
-            with pytest.raises(Exception):
-                parser.parse(f.name)
-
-
-class TestEdgeCases:
-    """Test edge cases and minimal graphs."""
+        with pytest.raises(ValueError, match="Invalid YAML"):
+            parse_yaml(invalid_yaml)
 
-    def test_minimal_graph_one_node(self):
-        from argviz.parser import YAMLParser
-        from argviz.model import GraphModel
-        import tempfile
 
-        minimal_yaml = """
+# Minimal parser inputs for TestEdgeCases
+ONE_NODE_YAML = """
 nodes:
   - type: Conclusion
     id: C1
     content: "Single conclusion"
 """
-        parser = YAMLParser()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(minimal_yaml)
-            f.flush()
-            model = parser.parse(f.name)
-            assert len(model.nodes) == 1
-            assert len(model.links) == 0
-
-    def test_graph_with_no_links(self):
-        from argviz.parser import YAMLParser
-        import tempfile
-
-        no_links_yaml = """
+
+NO_LINKS_YAML = """
 nodes:
   - type: Proposition
     id: P1
@@ -288,31 +552,118 @@ nodes:
     id: P2
     content: "Second claim"
 """
-        parser = YAMLParser()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(no_links_yaml)
-            f.flush()
-            model = parser.parse(f.name)
-            assert len(model.nodes) == 2
-            assert len(model.links) == 0
-
-    def test_export_minimal_graph(self):
-        from argviz.parser import YAMLParser
-        from argviz.exporters.dot import DOTExporter
-        import tempfile
-
-        minimal_yaml = """
-nodes:
-  - type: Conclusion
-    id: C1
-    content: "Single conclusion"
-"""
-        parser = YAMLParser()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(minimal_yaml)
-            f.flush()
-            model = parser.parse(f.name)
-            exporter = DOTExporter()
-            dot_output = exporter.export(model)
-            assert "digraph" in dot_output
-            assert "C1" in dot_output
+
+
+class TestEdgeCases:
+    """Test edge cases and minimal graphs."""
+
+    @pytest.mark.parametrize(
+        "yaml_text, node_ids",
+        [(ONE_NODE_YAML, ["C1"]), (NO_LINKS_YAML, ["P1", "P2"])],
+        ids=["one-node", "no-links"],
+    )
+    def test_minimal_graph_roundtrip(self, parse_yaml, yaml_text, node_ids):
+        model = parse_yaml(yaml_text)
+        assert list(model.nodes) == node_ids
+        assert len(model.links) == 0
+
+        dot_output = DOTExporter().export(model)
+        assert "digraph" in dot_output
+        for node_id in node_ids:
+            assert node_id in dot_output
+
+    def test_export_empty_graph(self):
+        model = GraphModel({"nodes": [], "links": []})
+        dot_output = DOTExporter().export(model)
+        assert dot_output.startswith("digraph")
+        assert dot_output.endswith("}")
+        data = json.loads(CytoscapeExporter().export(model))
+        assert data["elements"] == {"nodes": [], "edges": []}
+
+    def test_outline_export_deep_chain(self):
+        # Deeper than the recursion limit
+        depth = sys.getrecursionlimit() + 100
+        nodes = [{"id": "C1", "type": "Conclusion", "content": "Root"}]
+        links = []
+        for i in range(depth):
+            nodes.append({"id": f"P{i}", "type": "Proposition", "content": f"Claim {i}"})
+            target = "C1" if i == 0 else f"P{i - 1}"
+            links.append({"id": f"L{i}", "source_ids": [f"P{i}"], "target_id": target,
+                          "polarity": "supports"})
+        model = GraphModel({"nodes": nodes, "links": links})
+        lines = OutlineExporter().export(model).split("\n\n")
+        assert len(lines) == depth + 1
+        assert lines[-1].endswith(f"Claim {depth - 1}")
+
+
+# Outline covering a back-reference, a warrant and a co-premise group
+OUTLINE_TEXT = """1. [Conclusion] Root
+
+   1.1 [supports] [Datum] Evidence
+
+   1.1w1 [warrant] [Proposition] Bridge
+
+   1.2 [undermines] [Proposition] Doubt
+
+      1.2.1 [supports] (see 1.1)
+
+   1.3.1 [supports] [Proposition] Part A
+
+   1.3.2 [supports] [Proposition] Part B"""
+
+
+def _link_signatures(model):
+    """Count links by source contents, target and polarity, ignoring generated IDs."""
+    def describe(target_id):
+        if target_id in model.nodes:
+            return model.nodes[target_id]["content"]
+        link = model.links[target_id]
+        sources = tuple(sorted(model.nodes[s]["content"] for s in link["source_ids"]))
+        return (sources, describe(link["target_id"]), link["polarity"])
+
+    return collections.Counter(describe(link_id) for link_id in model.links)
+
+
+class TestOutlineParser:
+    """Test parsing the outline format back into a graph."""
+
+    def test_parse_structure(self):
+        model = OutlineParser().parse(OUTLINE_TEXT)
+        contents = sorted(node["content"] for node in model.nodes.values())
+        assert contents == ["Bridge", "Doubt", "Evidence", "Part A", "Part B", "Root"]
+
+        supports_root = (("Evidence",), "Root", "supports")
+        assert _link_signatures(model) == collections.Counter([
+            supports_root,
+            (("Doubt",), "Root", "undermines"),
+            # Back-reference reuses the Evidence node
+            (("Evidence",), "Doubt", "supports"),
+            # Co-premises share one link to their grandparent
+            (("Part A", "Part B"), "Root", "supports"),
+            # Warrant targets the link from 1.1
+            (("Bridge",), supports_root, "supports"),
+        ])
+
+    def test_line_pattern_groups(self):
+        match = OutlineParser.LINE_PATTERN.match("      1.2.1 [supports] (see 1.1)")
+        assert match.groups() == ("      ", "1.2.1", "supports", None, "(see 1.1)")
+        match = OutlineParser.LINE_PATTERN.match("   1.1 [supports] [Datum] Evidence")
+        assert match.groups() == ("   ", "1.1", "supports", "Datum", "Evidence")
+
+    def test_bad_indentation(self):
+        text = "1. [Conclusion] Root\n  1.1 [supports] [Datum] Evidence"
+        with pytest.raises(OutlineParseError, match="Invalid indentation") as excinfo:
+            OutlineParser().parse(text)
+        assert excinfo.value.line_number == 2
+
+    def test_parse_from_file_crlf(self, tmp_path):
+        path = tmp_path / "outline.txt"
+        path.write_bytes(OUTLINE_TEXT.replace("\n", "\r\n").encode())
+        model = OutlineParser().parse_from_file(path)
+        assert _link_signatures(model) == _link_signatures(OutlineParser().parse(OUTLINE_TEXT))
+        assert not any(node["content"].endswith("\r") for node in model.nodes.values())
+
+    def test_export_parse_roundtrip(self, example_model):
+        model = OutlineParser().parse(OutlineExporter().export(example_model))
+        assert len(model.nodes) == len(example_model.nodes)
+        assert _link_signatures(model) == _link_signatures(example_model)